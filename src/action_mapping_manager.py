@@ -403,6 +403,12 @@ class ActionMappingManager:
         
         return mappings
     
+    def get_mapping_count(self, enabled_only: bool = True) -> int:
+        """Count mappings in the current profile without building a sorted list"""
+        if enabled_only:
+            return sum(1 for m in self.mappings.values() if m.enabled)
+        return len(self.mappings)
+    
     def get_available_profiles(self) -> List[Dict[str, Any]]:
         """Get list of available profiles"""
         return list(self.profiles.values())
@@ -0,0 +1,40 @@
+"""
+Run blocking calls (file I/O) on Qt's global thread pool
+
+Results come back through a signal that Qt queues to the GUI thread.
+"""
+
+from typing import Optional
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class BackgroundTaskSignals(QObject):
+    """Signals for BackgroundTask (QRunnable cannot emit signals itself)"""
+    finished = Signal(bool, object)  # completed without raising, result or exception
+
+
+class BackgroundTask(QRunnable):
+    """Run fn(*args) on the global thread pool"""
+
+    def __init__(self, fn, *args, parent: Optional[QObject] = None):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        # Parented to a GUI-thread object so it outlives the runnable and slots run on the GUI thread
+        self.signals = BackgroundTaskSignals(parent)
+
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.finished.emit(False, e)
+            return
+        self.signals.finished.emit(True, result)
+
+
+def start_background_task(parent: QObject, on_finished, fn, *args):
+    """Run fn(*args) off the GUI thread; on_finished(ok, result) runs on parent's thread"""
+    task = BackgroundTask(fn, *args, parent=parent)
+    task.signals.finished.connect(on_finished)
+    task.signals.finished.connect(task.signals.deleteLater)
+    QThreadPool.globalInstance().start(task)
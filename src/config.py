@@ -17,7 +17,8 @@ MEDIAPIPE_CONFIG = {
     'static_image_mode': False,
     'max_num_hands': 2,
     'min_detection_confidence': 0.7,
-    'min_tracking_confidence': 0.5
+    'min_tracking_confidence': 0.5,
+    'model_complexity': 0          # 0=lite (fastest), 1=full (higher accuracy)
 }
 
 # Gesture Recognition Configuration
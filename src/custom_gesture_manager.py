@@ -345,6 +345,10 @@ class CustomGestureManager:
         """
         return list(self.gestures_metadata.values())
 
+    def get_gesture_count(self) -> int:
+        """Get the number of custom gestures without copying the list"""
+        return len(self.gestures_metadata)
+
     def check_gesture_similarity(self, gesture_name: str) -> List[Tuple[str, float]]:
         """
         GFLOW-10: Check similarity with existing gestures
@@ -3,16 +3,19 @@ import cv2
 import numpy as np
 from PySide6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout,
                                QHBoxLayout, QWidget, QPushButton, QLabel,
-                               QTextEdit, QFrame)
-from PySide6.QtCore import QTimer, QThread, Signal, Qt
+                               QTextEdit, QFrame, QMessageBox, QFileDialog)
+from PySide6.QtCore import QTimer, QThread, Signal, Qt, QEvent
 from PySide6.QtCore import QSettings
 import json
 
 from PySide6.QtGui import QImage, QPixmap, QFont, QIcon
 import mediapipe as mp
 import time
-import math
-from typing import Optional, Dict, List, Tuple
+import queue
+from collections import deque
+from types import SimpleNamespace
+from functools import partial
+from typing import Optional, Dict, List, Tuple, NamedTuple
 from config import (WEBCAM_CONFIG, MEDIAPIPE_CONFIG, GESTURE_CONFIG,
                    PERFORMANCE_CONFIG, UI_CONFIG, PREDEFINED_GESTURES, CUSTOM_GESTURE_CONFIG,
                    ACTION_EXECUTION_CONFIG, VISUAL_FEEDBACK_CONFIG, MOUSE_CONTROL_CONFIG, ASSETS_CONFIG)
@@ -22,17 +25,82 @@ from gesture_management_dialog import GestureManagementDialog
 from action_mapping_dialog import ActionMappingDialog
 from action_mapping_manager import ActionMappingManager
 from action_executor import ActionExecutor
-from settings_dialog import SettingsDialog
+from settings_dialog import SettingsDialog, load_saved_settings
+from background_task import start_background_task
 from profile_manager import ProfileManager
 from profile_management_dialog import ProfileManagementDialog
 from notification_widget import NotificationWidget, GestureNotificationManager
 
+# Gesture source ids used inside recognition; names are resolved only on return
+TYPE_PREDEFINED, TYPE_CUSTOM = 0, 1
+GESTURE_TYPE_NAMES = ('predefined', 'custom')
+
+# Stand-in for MediaPipe results when hand tracking is skipped
+_EMPTY_RESULTS = SimpleNamespace(multi_hand_landmarks=None)
+
+class CaptureThread(QThread):
+    """
+    Webcam frame producer for WebcamThread
+    Grabs frames, applies colour conversion, and keeps only the
+    newest frame in a single-slot queue so inference never lags behind
+    """
+    error_occurred = Signal(str)
+
+    # Extra grabs allowed per loop to skip frames queued by the capture driver
+    MAX_DRAIN_GRABS = 2
+    # A grab returning faster than this came from the driver queue, not the sensor
+    BUFFERED_GRAB_SECONDS = 0.005
+
+    def __init__(self, frame_queue: queue.Queue):
+        super().__init__()
+        self.running = False
+        self.cap = None
+        self.frame_queue = frame_queue
+
+    def run(self):
+        """Capture loop"""
+        while self.running and self.cap and self.cap.isOpened():
+            # Always process the newest frame: keep grabbing while grabs return
+            # instantly (already buffered), then decode only the last one
+            ret = False
+            for _ in range(1 + self.MAX_DRAIN_GRABS):
+                grab_start = time.perf_counter()
+                ret = self.cap.grab()
+                if not ret or time.perf_counter() - grab_start > self.BUFFERED_GRAB_SECONDS:
+                    break
+            if ret:
+                ret, frame = self.cap.retrieve()
+            if not ret:
+                self.error_occurred.emit("Failed to read from webcam")
+                break
+
+            # Convert BGR to RGB for MediaPipe. Always use cvtColor here, never
+            # frame[..., ::-1]: the slice is a non-contiguous view that every
+            # downstream consumer (MediaPipe included) has to copy, which ends
+            # up slower than the conversion it was meant to save
+            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+            # Replace any frame the inference thread hasn't picked up yet
+            try:
+                self.frame_queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self.frame_queue.put_nowait((frame, rgb_frame))
+            except queue.Full:
+                pass
+
+        self.running = False
+
+
 class WebcamThread(QThread):
     """
     GFLOW-1 & GFLOW-2: Webcam capture and MediaPipe hand tracking thread
-    Handles webcam input and MediaPipe hand landmark detection
+    Handles webcam input and MediaPipe hand landmark detection.
+    Capture runs on a separate CaptureThread so the next frame is read and
+    converted while MediaPipe processes the current one.
     """
-    frame_ready = Signal(np.ndarray, list)  # frame, hand_landmarks
+    frame_ready = Signal(QImage, list)  # frame, hand_landmarks
     error_occurred = Signal(str)
     fps_update = Signal(float)
 
@@ -41,15 +109,18 @@ class WebcamThread(QThread):
         self.running = False
         self.cap = None
 
-        # Initialize MediaPipe
+        # Single-slot hand-off between capture and inference; stale frames are dropped
+        self.frame_queue = queue.Queue(maxsize=1)
+        self.capture_thread = CaptureThread(self.frame_queue)
+        self.capture_thread.error_occurred.connect(self.error_occurred)
+
+        # Initialize MediaPipe; the Hands graph itself is built on the worker
+        # thread (see _build_hands) so it always reflects MEDIAPIPE_CONFIG
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=MEDIAPIPE_CONFIG['static_image_mode'],
-            max_num_hands=MEDIAPIPE_CONFIG['max_num_hands'],
-            min_detection_confidence=MEDIAPIPE_CONFIG['min_detection_confidence'],
-            min_tracking_confidence=MEDIAPIPE_CONFIG['min_tracking_confidence']
-        )
-        self.mp_drawing = mp.solutions.drawing_utils
+        self.hands = None
+        self._hands_stale = True
+        # (start, end) landmark index pairs, used to draw all connections in one call
+        self._conn_idx = np.array(list(self.mp_hands.HAND_CONNECTIONS), dtype=np.int32)
 
         # FPS tracking
         self.fps_counter = 0
@@ -58,6 +129,53 @@ class WebcamThread(QThread):
         # Store current landmarks for custom gesture recording
         self.current_landmarks = []
 
+        # GFLOW-17: Skip MediaPipe entirely while recognition is disabled
+        self._recognition_enabled = True
+
+        # Display size frames are scaled to before emitting; (0, 0) = no scaling
+        self._target_size = (0, 0)
+
+    def _build_hands(self):
+        """(Re)create the MediaPipe Hands graph from the current MEDIAPIPE_CONFIG"""
+        if self.hands is not None:
+            self.hands.close()
+        self.hands = self.mp_hands.Hands(
+            static_image_mode=MEDIAPIPE_CONFIG['static_image_mode'],
+            max_num_hands=MEDIAPIPE_CONFIG['max_num_hands'],
+            min_detection_confidence=MEDIAPIPE_CONFIG['min_detection_confidence'],
+            min_tracking_confidence=MEDIAPIPE_CONFIG['min_tracking_confidence'],
+            # Lite model roughly halves inference cost; landmark accuracy is
+            # well within what the rule-based recognizer needs
+            model_complexity=MEDIAPIPE_CONFIG.get('model_complexity', 0)
+        )
+
+    def reconfigure(self):
+        """Rebuild hand tracking with the current MEDIAPIPE_CONFIG (safe to call from the UI thread)"""
+        self._hands_stale = True
+
+    def set_recognition_enabled(self, enabled: bool):
+        """Enable or disable hand tracking (safe to call from the UI thread)"""
+        self._recognition_enabled = enabled
+
+    def set_target_size(self, width: int, height: int):
+        """Set the video display size (safe to call from the UI thread)"""
+        # Single tuple assignment so the worker never sees a half-updated size
+        self._target_size = (width, height)
+
+    def _fit_to_target(self, frame: np.ndarray) -> np.ndarray:
+        """Scale frame to fit the display size, keeping aspect ratio"""
+        tw, th = self._target_size
+        if tw <= 0 or th <= 0:
+            return frame
+        h, w = frame.shape[:2]
+        scale = min(tw / w, th / h)
+        new_w, new_h = max(1, int(w * scale)), max(1, int(h * scale))
+        if (new_w, new_h) == (w, h):
+            return frame
+        # INTER_AREA avoids aliasing when shrinking; INTER_LINEAR is cheaper for enlarging
+        interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
+        return cv2.resize(frame, (new_w, new_h), interpolation=interpolation)
+
     def start_capture(self):
         """Start webcam capture"""
         try:
@@ -70,6 +188,18 @@ class WebcamThread(QThread):
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, WEBCAM_CONFIG['width'])
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, WEBCAM_CONFIG['height'])
             self.cap.set(cv2.CAP_PROP_FPS, WEBCAM_CONFIG['fps'])
+            # Keep driver-side buffering minimal so frames don't go stale (not all backends support it)
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+            # Drop any frame left over from a previous session
+            try:
+                self.frame_queue.get_nowait()
+            except queue.Empty:
+                pass
+
+            self.capture_thread.cap = self.cap
+            self.capture_thread.running = True
+            self.capture_thread.start()
 
             self.running = True
             self.start()
@@ -81,27 +211,57 @@ class WebcamThread(QThread):
     def stop_capture(self):
         """Stop webcam capture"""
         self.running = False
+        self.capture_thread.running = False
+        # Capture must be idle before the device is released
+        self.capture_thread.wait()
         if self.cap:
             self.cap.release()
         self.wait()
 
-    def run(self):
-        """Main capture loop"""
-        while self.running and self.cap and self.cap.isOpened():
-            ret, frame = self.cap.read()
-            if not ret:
-                self.error_occurred.emit("Failed to read from webcam")
-                break
+    def _draw_landmarks(self, frame: np.ndarray, landmarks: List[Tuple[float, float, float]]):
+        """Draw hand connections and joints using batched OpenCV calls"""
+        h, w = frame.shape[:2]
+        pts = (np.asarray(landmarks)[:, :2] * (w, h)).astype(np.int32)
 
-            # Flip frame horizontally for mirror effect (if enabled)
-            if WEBCAM_CONFIG['flip_horizontal']:
-                frame = cv2.flip(frame, 1)
+        # One polylines call for every connection instead of one cv2.line per pair
+        cv2.polylines(frame, pts[self._conn_idx], False,
+                      VISUAL_FEEDBACK_CONFIG['connection_color'],
+                      VISUAL_FEEDBACK_CONFIG['connection_thickness'])
 
-            # Convert BGR to RGB for MediaPipe
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        color = VISUAL_FEEDBACK_CONFIG['landmark_color']
+        thickness = VISUAL_FEEDBACK_CONFIG['landmark_thickness']
+        for x, y in pts.tolist():
+            cv2.circle(frame, (x, y), 2, color, thickness)
+
+    def run(self):
+        """Main inference loop"""
+        while self.running:
+            try:
+                frame, rgb_frame = self.frame_queue.get(timeout=0.1)
+            except queue.Empty:
+                if not self.capture_thread.isRunning():
+                    break
+                continue
+
+            # MediaPipe's C++ graph needs a contiguous buffer; guard against a
+            # strided view sneaking in from the capture side
+            if not rgb_frame.flags['C_CONTIGUOUS']:
+                if GESTURE_CONFIG['debug_mode']:
+                    print("Warning: non-contiguous RGB frame passed to MediaPipe, copying")
+                rgb_frame = np.ascontiguousarray(rgb_frame)
 
             # Process with MediaPipe
-            results = self.hands.process(rgb_frame)
+            if self._recognition_enabled:
+                if self._hands_stale:
+                    self._hands_stale = False
+                    self._build_hands()
+                results = self.hands.process(rgb_frame)
+            else:
+                results = _EMPTY_RESULTS
+
+            # Mirror effect is applied in landmark space (x -> 1 - x) rather
+            # than flipping the full frame before MediaPipe
+            mirror = WEBCAM_CONFIG['flip_horizontal']
 
             # Extract hand landmarks
             hand_landmarks = []
@@ -110,25 +270,24 @@ class WebcamThread(QThread):
                     # Convert landmarks to list of (x, y) coordinates
                     landmarks = []
                     for lm in hand_landmark.landmark:
+                        # Mirror in place so current_landmarks (used for recording) match
+                        if mirror:
+                            lm.x = 1.0 - lm.x
                         landmarks.append((lm.x, lm.y, lm.z))
                     hand_landmarks.append(landmarks)
 
-                    # GFLOW-19: Draw landmarks on frame (toggleable)
-                    if VISUAL_FEEDBACK_CONFIG['show_hand_landmarks']:
-                        # Use configured colors and thickness
-                        landmark_spec = self.mp_drawing.DrawingSpec(
-                            color=VISUAL_FEEDBACK_CONFIG['landmark_color'],
-                            thickness=VISUAL_FEEDBACK_CONFIG['landmark_thickness']
-                        )
-                        connection_spec = self.mp_drawing.DrawingSpec(
-                            color=VISUAL_FEEDBACK_CONFIG['connection_color'],
-                            thickness=VISUAL_FEEDBACK_CONFIG['connection_thickness']
-                        )
-
-                        self.mp_drawing.draw_landmarks(
-                            frame, hand_landmark, self.mp_hands.HAND_CONNECTIONS,
-                            landmark_spec, connection_spec
-                        )
+            # Scale to the display size here rather than on the UI thread; doing it
+            # first also makes the flip and landmark drawing below cheaper
+            frame = self._fit_to_target(frame)
+
+            # Flip (if enabled) for display only
+            if mirror:
+                frame = cv2.flip(frame, 1)
+
+            # GFLOW-19: Draw landmarks on frame (toggleable)
+            if VISUAL_FEEDBACK_CONFIG['show_hand_landmarks']:
+                for landmarks in hand_landmarks:
+                    self._draw_landmarks(frame, landmarks)
 
             # Store current landmarks for custom gesture recording
             self.current_landmarks = results.multi_hand_landmarks if results.multi_hand_landmarks else []
@@ -142,8 +301,14 @@ class WebcamThread(QThread):
                 self.fps_update.emit(fps)
                 self.fps_start_time = current_time
 
+            # Build the QImage here (frame is already display-sized BGR) so the UI
+            # thread only has to upload it. copy() detaches it from the numpy
+            # buffer, which is freed once this iteration moves on
+            h, w = frame.shape[:2]
+            image = QImage(frame.data, w, h, frame.strides[0], QImage.Format_BGR888).copy()
+
             # Emit frame and landmarks
-            self.frame_ready.emit(frame, hand_landmarks)
+            self.frame_ready.emit(image, hand_landmarks)
 
             # Small delay to prevent overwhelming the UI
             self.msleep(33)  # ~30 FPS
@@ -174,7 +339,7 @@ class GestureRecognizer:
             # Check both custom and predefined gestures, then choose the best match
             best_gesture = None
             best_confidence = 0.0
-            best_type = ""
+            best_type = TYPE_PREDEFINED
 
             # Check custom gestures (GFLOW-8)
             # Convert landmarks to MediaPipe format for custom gesture recognition
@@ -189,33 +354,33 @@ class GestureRecognizer:
             if custom_gesture and custom_confidence >= CUSTOM_GESTURE_CONFIG['min_confidence_threshold']:
                 best_gesture = custom_gesture
                 best_confidence = custom_confidence
-                best_type = 'custom'
+                best_type = TYPE_CUSTOM
 
             # Check predefined gestures with confidence scoring
             predefined_results = []
 
             # Check for Open Palm
             if self._is_open_palm(landmarks):
-                predefined_results.append(('open_palm', 'predefined', 0.95))  # High confidence for rule-based
+                predefined_results.append(('open_palm', 0.95))  # High confidence for rule-based
 
             # Check for Thumbs Up
             if self._is_thumbs_up(landmarks):
-                predefined_results.append(('thumbs_up', 'predefined', 0.95))
+                predefined_results.append(('thumbs_up', 0.95))
 
             # Check for Fist
             if self._is_fist(landmarks):
-                predefined_results.append(('fist', 'predefined', 0.95))
+                predefined_results.append(('fist', 0.95))
 
             # Check for Peace Sign
             if self._is_peace_sign(landmarks):
-                predefined_results.append(('peace_sign', 'predefined', 0.95))
+                predefined_results.append(('peace_sign', 0.95))
 
             # Check for Pointing
             if self._is_pointing(landmarks):
-                predefined_results.append(('pointing', 'predefined', 0.95))
+                predefined_results.append(('pointing', 0.95))
 
             # Apply priority system: prefer predefined gestures when confidence is close
-            for gesture_id, gesture_type, confidence in predefined_results:
+            for gesture_id, confidence in predefined_results:
                 # Apply confidence boost to predefined gestures if priority system is enabled
                 if CUSTOM_GESTURE_CONFIG['enable_gesture_priority']:
                     effective_confidence = min(1.0, confidence + CUSTOM_GESTURE_CONFIG['predefined_confidence_boost'])
@@ -225,11 +390,11 @@ class GestureRecognizer:
                 if effective_confidence > best_confidence:
                     best_gesture = gesture_id
                     best_confidence = effective_confidence
-                    best_type = gesture_type
+                    best_type = TYPE_PREDEFINED
 
             # Return the best match if confidence is sufficient
             if best_gesture and best_confidence >= CUSTOM_GESTURE_CONFIG['min_confidence_threshold']:
-                return best_gesture, best_type
+                return best_gesture, GESTURE_TYPE_NAMES[best_type]
 
         except Exception as e:
             print(f"Error in gesture recognition: {e}")
@@ -343,11 +508,98 @@ class GestureRecognizer:
         return index_extended and all(other_fingers_folded)
 
 
+# GFLOW-E04: Reference landmark name -> MediaPipe landmark index
+_MOUSE_LANDMARK_INDEX = {
+    'wrist': 0,
+    'index_tip': 8
+}
+
+
+class MouseControlSettings(NamedTuple):
+    """GFLOW-E04: Immutable snapshot of MOUSE_CONTROL_CONFIG used per frame"""
+    enabled: bool
+    gesture_name: Optional[str]
+    gesture_type: Optional[str]
+    activation_frames: int
+    deactivation_frames: int
+    landmark_idx: int
+    invert_x: bool
+    invert_y: bool
+    deadzone_sq: float
+    gain: float
+    alpha: float
+
+    @classmethod
+    def from_config(cls, cfg: Dict) -> 'MouseControlSettings':
+        """Resolve defaults and derived values once, when the config changes"""
+        deadzone = float(cfg.get('deadzone_pixels', 3))
+        return cls(
+            enabled=cfg.get('enabled', True),
+            gesture_name=cfg.get('gesture_name'),
+            gesture_type=cfg.get('gesture_type'),
+            activation_frames=cfg.get('activation_frames', 3),
+            deactivation_frames=cfg.get('deactivation_frames', 2),
+            landmark_idx=_MOUSE_LANDMARK_INDEX.get(cfg.get('landmark', 'index_tip'), 8),
+            invert_x=cfg.get('invert_x', False),
+            invert_y=cfg.get('invert_y', False),
+            deadzone_sq=deadzone * deadzone,
+            gain=float(cfg.get('sensitivity', 1.5)),
+            alpha=float(cfg.get('smoothing', 0.5)),
+        )
+
+
+def _toggle_button_qss(color: str, hover_color: str) -> str:
+    """Build the stylesheet shared by the main window's toggle buttons"""
+    return f"""
+        QPushButton {{
+            background-color: {color};
+            color: white;
+            border: none;
+            padding: 8px 16px;
+            border-radius: 4px;
+            font-weight: bold;
+        }}
+        QPushButton:hover {{
+            background-color: {hover_color};
+        }}
+    """
+
+
+def _write_json(filename: str, data: dict):
+    """Write a settings JSON file (run off the UI thread)"""
+    with open(filename, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+def _read_json(filename: str) -> dict:
+    """Read a settings JSON file (run off the UI thread)"""
+    with open(filename, 'r') as f:
+        return json.load(f)
+
+
 class MainWindow(QMainWindow):
     """
     Main application window implementing GFLOW-1 through GFLOW-4
     """
 
+    # Stylesheets are built once and reused; keyed by the toggle's current state
+    _REC_BUTTON_QSS = {
+        True: _toggle_button_qss('#e74c3c', '#c0392b'),   # Recognition on -> "Disable"
+        False: _toggle_button_qss('#27ae60', '#229954'),  # Recognition off -> "Enable"
+    }
+    _LANDMARKS_BUTTON_QSS = {
+        True: _toggle_button_qss('#e74c3c', '#c0392b'),   # Landmarks shown -> "Hide"
+        False: _toggle_button_qss('#2ecc71', '#27ae60'),  # Landmarks hidden -> "Show"
+    }
+    _LABEL_QSS_GREEN = "color: green; font-weight: bold;"
+    _LABEL_QSS_RED = "color: red; font-weight: bold;"
+    _LABEL_QSS_GRAY = "color: gray; font-weight: bold;"
+    _LABEL_QSS_BLUE = "color: blue; font-weight: bold;"
+    _LABEL_QSS_PURPLE = "color: purple; font-weight: bold;"
+    _LABEL_QSS_ORANGE = "color: orange; font-weight: bold;"
+    _REC_STATUS_QSS = {True: _LABEL_QSS_GREEN, False: _LABEL_QSS_RED}
+    _PERF_FMT = "Recognition latency: {:.1f} ms\nFrames processed: {}".format
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle(UI_CONFIG['window_title'])
@@ -369,6 +621,14 @@ class MainWindow(QMainWindow):
         # Initialize gesture recognizer with profile-aware custom gesture manager
         self.gesture_recognizer = GestureRecognizer(self.custom_gesture_manager)
 
+        # (label text, label style) per detected gesture, by gesture type;
+        # custom gesture entries are filled in on first sighting
+        self._gesture_display: Dict[str, Dict[str, Tuple[str, str]]] = {
+            'predefined': {g: (f"Detected: {name}", self._LABEL_QSS_GREEN)
+                           for g, name in self.gesture_recognizer.gesture_names.items()},
+            'custom': {},
+        }
+
         # Set up profile manager dependencies
         self.profile_manager.set_managers(
             self.action_mapping_manager,
@@ -379,13 +639,27 @@ class MainWindow(QMainWindow):
         if default_profile:
             self.profile_manager.load_profile(default_profile)
 
+        # GFLOW-E04: Per-frame mouse control settings (refreshed on settings changes)
+        self._update_mouse_control_settings()
+
+        # Settings section -> config dict it updates
+        self._settings_routes = {
+            'webcam': WEBCAM_CONFIG,
+            'mediapipe': MEDIAPIPE_CONFIG,
+            'gesture': GESTURE_CONFIG,
+            'performance': PERFORMANCE_CONFIG,
+            'custom_gesture': CUSTOM_GESTURE_CONFIG,
+            'action_execution': ACTION_EXECUTION_CONFIG,
+            'mouse_control': MOUSE_CONTROL_CONFIG,
+            'visual_feedback': VISUAL_FEEDBACK_CONFIG,
+        }
+
         # Load persisted application settings at startup (GFLOW-17)
         try:
             qs = QSettings("GestureFlow", "Settings")
             if qs.contains("settings"):
-                settings_str = qs.value("settings")
-                if settings_str:
-                    saved_settings = json.loads(settings_str)
+                saved_settings = load_saved_settings(qs)
+                if saved_settings:
                     # Apply to runtime configs
                     self.apply_new_settings(saved_settings)
         except Exception as e:
@@ -400,12 +674,16 @@ class MainWindow(QMainWindow):
 
         # Performance tracking (GFLOW-4)
         self.frame_count = 0
-        self.recognition_times = []
+        # Window for the displayed average latency, with a running sum so the
+        # average is O(1) per frame
+        self._recent_latencies = deque(maxlen=30)
+        self._recent_latency_sum = 0.0
         self.start_time = time.time()
 
         # Action execution tracking
         self.last_executed_gesture = None
-        self.last_execution_time = 0
+        self.last_execution_time_ns = 0
+        self._cooldown_ns = 1_000_000_000  # 1 second between repeats of the same gesture
         # GFLOW-E04: Mouse control state
         self.mouse_control_active = False
         self.mouse_activation_counter = 0
@@ -413,14 +691,22 @@ class MainWindow(QMainWindow):
         self.prev_ref_point: Optional[Tuple[float, float]] = None
         self.prev_delta: Tuple[float, float] = (0.0, 0.0)
 
+        # Dialogs are built on first open and reused afterwards
+        self._settings_dialog: Optional[SettingsDialog] = None
+        self._action_mapping_dialog: Optional[ActionMappingDialog] = None
 
         # GFLOW-17: Enhanced recognition control
         self.recognition_enabled = True  # Separate from webcam control
 
+        # Last FPS text shown, so unchanged readings skip the repaint
+        self._fps_text = "FPS: --"
+
         self.setup_ui()
 
         # GFLOW-19: Initialize visual feedback system
         self.setup_visual_feedback()
+        # Resolved once; the notification manager never comes or goes afterwards
+        self._has_notifications: bool = hasattr(self, 'notification_manager')
 
         self.connect_signals()
 
@@ -447,6 +733,8 @@ class MainWindow(QMainWindow):
         self.video_label.setStyleSheet("border: 2px solid gray; background-color: black;")
         self.video_label.setAlignment(Qt.AlignCenter)
         self.video_label.setText("Webcam feed will appear here")
+        # Forward size changes to the webcam thread, which pre-scales frames
+        self.video_label.installEventFilter(self)
         left_panel.addWidget(self.video_label)
 
         # Control buttons
@@ -462,38 +750,14 @@ class MainWindow(QMainWindow):
         # GFLOW-17: Recognition control buttons
         recognition_layout = QHBoxLayout()
         self.recognition_toggle_button = QPushButton("Disable Recognition")
-        self.recognition_toggle_button.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-        """)
+        self.recognition_toggle_button.setStyleSheet(self._REC_BUTTON_QSS[True])
         recognition_layout.addWidget(self.recognition_toggle_button)
         left_panel.addLayout(recognition_layout)
 
         # GFLOW-19: Visual feedback controls
         visual_feedback_layout = QHBoxLayout()
         self.landmarks_toggle_button = QPushButton("Hide Landmarks" if VISUAL_FEEDBACK_CONFIG['show_hand_landmarks'] else "Show Landmarks")
-        self.landmarks_toggle_button.setStyleSheet("""
-            QPushButton {
-                background-color: #2ecc71;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #27ae60;
-            }
-        """)
+        self.landmarks_toggle_button.setStyleSheet(self._LANDMARKS_BUTTON_QSS[VISUAL_FEEDBACK_CONFIG['show_hand_landmarks']])
         visual_feedback_layout.addWidget(self.landmarks_toggle_button)
         left_panel.addLayout(visual_feedback_layout)
 
@@ -516,7 +780,7 @@ class MainWindow(QMainWindow):
         self.hands_label = QLabel("Hands detected: 0")
         # GFLOW-17: Enhanced status indicators
         self.recognition_status_label = QLabel("Recognition: Enabled")
-        self.recognition_status_label.setStyleSheet("color: green; font-weight: bold;")
+        self.recognition_status_label.setStyleSheet(self._LABEL_QSS_GREEN)
 
         # GFLOW-18: Profile status indicator
         self.profile_status_label = QLabel("Profile: Loading...")
@@ -541,8 +805,12 @@ class MainWindow(QMainWindow):
 
         self.gesture_label = QLabel("No gesture detected")
         self.gesture_label.setFont(QFont("Arial", 14))
-        self.gesture_label.setStyleSheet("color: blue; font-weight: bold;")
+        self.gesture_label.setStyleSheet(self._LABEL_QSS_BLUE)
         gesture_layout.addWidget(self.gesture_label)
+        # Last values pushed to the per-frame labels (skip redundant repaints/restyles)
+        self._last_gesture_text = "No gesture detected"
+        self._last_gesture_style = self._LABEL_QSS_BLUE
+        self._last_hands_count = 0
 
         # Default Supported gestures list
         supported_label = QLabel("Default Supported Gestures:")
@@ -669,7 +937,6 @@ class MainWindow(QMainWindow):
     def open_recording_dialog(self):
         """Open the gesture recording dialog"""
         if not self.webcam_thread.running:
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.warning(
                 self, "Webcam Required",
                 "Please start the webcam before recording gestures."
@@ -681,7 +948,10 @@ class MainWindow(QMainWindow):
             self.webcam_thread,
             self
         )
+        # Recording needs landmarks even when recognition is switched off
+        self.webcam_thread.set_recognition_enabled(True)
         dialog.exec()
+        self.webcam_thread.set_recognition_enabled(self.recognition_enabled)
 
         # Refresh gesture list after recording
         self.refresh_gestures()
@@ -754,13 +1024,11 @@ class MainWindow(QMainWindow):
         if self.profile_manager.load_profile(profile_name):
             self.on_profile_changed(profile_name)
 
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.information(
                 self, "Profile Switched",
                 f"Switched to profile: {profile_name}"
             )
         else:
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.critical(
                 self, "Error",
                 f"Failed to switch to profile: {profile_name}"
@@ -769,102 +1037,49 @@ class MainWindow(QMainWindow):
     def toggle_recognition(self):
         """GFLOW-17: Toggle gesture recognition on/off"""
         self.recognition_enabled = not self.recognition_enabled
+        self.webcam_thread.set_recognition_enabled(self.recognition_enabled)
+
+        self.recognition_toggle_button.setStyleSheet(self._REC_BUTTON_QSS[self.recognition_enabled])
+        self.recognition_status_label.setStyleSheet(self._REC_STATUS_QSS[self.recognition_enabled])
 
         if self.recognition_enabled:
             self.recognition_toggle_button.setText("Disable Recognition")
-            self.recognition_toggle_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #e74c3c;
-                    color: white;
-                    border: none;
-                    padding: 8px 16px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #c0392b;
-                }
-            """)
             self.recognition_status_label.setText("Recognition: Enabled")
-            self.recognition_status_label.setStyleSheet("color: green; font-weight: bold;")
         else:
             self.recognition_toggle_button.setText("Enable Recognition")
-            self.recognition_toggle_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #27ae60;
-                    color: white;
-                    border: none;
-                    padding: 8px 16px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #229954;
-                }
-            """)
             self.recognition_status_label.setText("Recognition: Disabled")
-            self.recognition_status_label.setStyleSheet("color: red; font-weight: bold;")
 
             # Clear gesture display when disabled
-            self.gesture_label.setText("Recognition disabled")
-            self.gesture_label.setStyleSheet("color: gray; font-weight: bold;")
+            self._set_gesture_label("Recognition disabled", self._LABEL_QSS_GRAY)
 
     def toggle_landmarks(self):
         """GFLOW-19: Toggle hand landmarks display"""
-        current_state = VISUAL_FEEDBACK_CONFIG['show_hand_landmarks']
-        VISUAL_FEEDBACK_CONFIG['show_hand_landmarks'] = not current_state
+        show = not VISUAL_FEEDBACK_CONFIG['show_hand_landmarks']
+        VISUAL_FEEDBACK_CONFIG['show_hand_landmarks'] = show
 
         # Update button text and style
-        if VISUAL_FEEDBACK_CONFIG['show_hand_landmarks']:
-            self.landmarks_toggle_button.setText("Hide Landmarks")
-            self.landmarks_toggle_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #e74c3c;
-                    color: white;
-                    border: none;
-                    padding: 8px 16px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #c0392b;
-                }
-            """)
-        else:
-            self.landmarks_toggle_button.setText("Show Landmarks")
-            self.landmarks_toggle_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #2ecc71;
-                    color: white;
-                    border: none;
-                    padding: 8px 16px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #27ae60;
-                }
-            """)
+        self.landmarks_toggle_button.setText("Hide Landmarks" if show else "Show Landmarks")
+        self.landmarks_toggle_button.setStyleSheet(self._LANDMARKS_BUTTON_QSS[show])
 
     def open_settings_dialog(self):
         """GFLOW-17: Open the settings dialog"""
-        dialog = SettingsDialog(self, profile_manager=self.profile_manager, custom_gesture_manager=self.custom_gesture_manager)
-        dialog.settings_changed.connect(self.apply_new_settings)
-
-        # Keep a reference to prevent garbage collection
-        self._settings_dialog = dialog
-
-        # Connect finished signal to clean up reference
-        dialog.finished.connect(lambda: setattr(self, '_settings_dialog', None))
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(self, profile_manager=self.profile_manager, custom_gesture_manager=self.custom_gesture_manager)
+            self._settings_dialog.settings_changed.connect(self.apply_new_settings)
+        else:
+            # Reused dialog: resync controls with the live config, dropping
+            # edits left over from a cancelled session
+            dialog = self._settings_dialog
+            dialog.original_settings = dialog.get_current_settings()
+            dialog.current_settings = dialog.original_settings.copy()
+            dialog.populate_mouse_gesture_list()
+            dialog.apply_loaded_settings(dialog.original_settings)
 
-        dialog.exec()
+        self._settings_dialog.exec()
 
     def apply_new_settings(self, settings: dict):
         """Apply new settings from settings dialog"""
         try:
-            # Update global configuration (this would ideally update the config module)
-            # For now, we'll store the settings and apply what we can immediately
-
             # Update UI elements that can be changed immediately
             if 'ui' in settings:
                 ui_settings = settings['ui']
@@ -872,9 +1087,26 @@ class MainWindow(QMainWindow):
                     self.setWindowTitle(ui_settings['window_title'])
                     UI_CONFIG['window_title'] = ui_settings['window_title']
 
-            # Update webcam settings (requires restart of webcam)
+            # Route each incoming section to its config dict in one pass
+            for key, values in settings.items():
+                if key not in self._settings_routes:
+                    continue
+                self._settings_routes[key] |= values  # in-place merge (Python 3.9+)
+
+            # Side effects for sections that need more than a config update
+            if 'mouse_control' in settings:
+                self._update_mouse_control_settings()
+
+            # Hand tracking picks up model/confidence changes on its next frame
+            if 'mediapipe' in settings and hasattr(self, 'webcam_thread'):
+                self.webcam_thread.reconfigure()
+
+            # Notification widget keeps a snapshot of the visual feedback config
+            if 'visual_feedback' in settings and hasattr(self, 'notification_widget'):
+                self.notification_widget.apply_config()
+
+            # Webcam settings require a restart of the webcam to take effect
             if 'webcam' in settings and self.webcam_thread.running:
-                from PySide6.QtWidgets import QMessageBox
                 reply = QMessageBox.question(
                     self, "Restart Webcam",
                     "Webcam settings have changed. Restart webcam to apply changes?",
@@ -883,56 +1115,13 @@ class MainWindow(QMainWindow):
                 )
 
                 if reply == QMessageBox.Yes:
-                    # Update webcam config and restart
-                    WEBCAM_CONFIG.update(settings['webcam'])
                     self.stop_webcam()
                     # Small delay before restart
                     QTimer.singleShot(500, self.start_webcam)
-                else:
-                    # Still update the config for next time
-                    WEBCAM_CONFIG.update(settings['webcam'])
-            elif 'webcam' in settings:
-                # Update webcam config even if not running
-                WEBCAM_CONFIG.update(settings['webcam'])
-
-            # Update other configurations safely
-            if 'mediapipe' in settings:
-                MEDIAPIPE_CONFIG.update(settings['mediapipe'])
-
-            if 'gesture' in settings:
-                GESTURE_CONFIG.update(settings['gesture'])
-
-            if 'performance' in settings:
-                PERFORMANCE_CONFIG.update(settings['performance'])
-
-            if 'custom_gesture' in settings:
-                CUSTOM_GESTURE_CONFIG.update(settings['custom_gesture'])
-
-            if 'action_execution' in settings:
-                # Check if ACTION_EXECUTION_CONFIG exists before updating
-                try:
-                    from config import ACTION_EXECUTION_CONFIG
-                    ACTION_EXECUTION_CONFIG.update(settings['action_execution'])
-                except (ImportError, NameError) as e:
-                    print(f"ACTION_EXECUTION_CONFIG not available, skipping action execution settings: {e}")
 
             print("Settings applied successfully")
-            if 'mouse_control' in settings:
-                try:
-                    from config import MOUSE_CONTROL_CONFIG
-                    MOUSE_CONTROL_CONFIG.update(settings['mouse_control'])
-                except (ImportError, NameError) as e:
-                    print(f"MOUSE_CONTROL_CONFIG not available, skipping mouse control settings: {e}")
-
-            if 'visual_feedback' in settings:
-                try:
-                    from config import VISUAL_FEEDBACK_CONFIG
-                    VISUAL_FEEDBACK_CONFIG.update(settings['visual_feedback'])
-                except (ImportError, NameError) as e:
-                    print(f"VISUAL_FEEDBACK_CONFIG not available, skipping visual feedback settings: {e}")
 
         except Exception as e:
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.critical(
                 self, "Settings Error",
                 f"Failed to apply some settings: {str(e)}\n\nDetails: {type(e).__name__}"
@@ -941,9 +1130,6 @@ class MainWindow(QMainWindow):
     def export_settings(self):
         """Export current settings to file"""
         try:
-            from PySide6.QtWidgets import QFileDialog
-            import json
-
             filename, _ = QFileDialog.getSaveFileName(
                 self, "Export Settings",
                 "gestureflow_settings.json",
@@ -951,43 +1137,45 @@ class MainWindow(QMainWindow):
             )
 
             if filename:
+                # Snapshot on the UI thread so the writer never sees a dict mid-update
                 settings = {
-                    'webcam': WEBCAM_CONFIG,
-                    'mediapipe': MEDIAPIPE_CONFIG,
-                    'gesture': GESTURE_CONFIG,
-                    'performance': PERFORMANCE_CONFIG,
-                    'ui': UI_CONFIG,
-                    'custom_gesture': CUSTOM_GESTURE_CONFIG,
+                    'webcam': dict(WEBCAM_CONFIG),
+                    'mediapipe': dict(MEDIAPIPE_CONFIG),
+                    'gesture': dict(GESTURE_CONFIG),
+                    'performance': dict(PERFORMANCE_CONFIG),
+                    'ui': dict(UI_CONFIG),
+                    'custom_gesture': dict(CUSTOM_GESTURE_CONFIG),
+                    'action_execution': dict(ACTION_EXECUTION_CONFIG),
                 }
 
-                # Add action execution config if available
-                try:
-                    settings['action_execution'] = ACTION_EXECUTION_CONFIG
-                except NameError:
-                    print("ACTION_EXECUTION_CONFIG not available for export")
-
-                with open(filename, 'w') as f:
-                    json.dump(settings, f, indent=2)
-
-                from PySide6.QtWidgets import QMessageBox
-                QMessageBox.information(
-                    self, "Export Complete",
-                    f"Settings exported to {filename}"
-                )
+                self.status_label.setText("Exporting settings...")
+                start_background_task(self, partial(self._on_settings_exported, filename),
+                                      _write_json, filename, settings)
 
         except Exception as e:
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.critical(
                 self, "Export Error",
                 f"Failed to export settings: {str(e)}"
             )
 
+    def _on_settings_exported(self, filename: str, ok: bool, error):
+        """Report the result of a background settings export"""
+        self.status_label.setText("Settings exported" if ok else "Settings export failed")
+        if not ok:
+            QMessageBox.critical(
+                self, "Export Error",
+                f"Failed to export settings: {str(error)}"
+            )
+            return
+
+        QMessageBox.information(
+            self, "Export Complete",
+            f"Settings exported to {filename}"
+        )
+
     def import_settings(self):
         """Import settings from file"""
         try:
-            from PySide6.QtWidgets import QFileDialog, QMessageBox
-            import json
-
             filename, _ = QFileDialog.getOpenFileName(
                 self, "Import Settings",
                 "",
@@ -995,24 +1183,34 @@ class MainWindow(QMainWindow):
             )
 
             if filename:
-                with open(filename, 'r') as f:
-                    settings = json.load(f)
-
-                # Apply imported settings
-                self.apply_new_settings(settings)
-
-                QMessageBox.information(
-                    self, "Import Complete",
-                    f"Settings imported from {filename}"
-                )
+                self.status_label.setText("Importing settings...")
+                start_background_task(self, partial(self._on_settings_imported, filename),
+                                      _read_json, filename)
 
         except Exception as e:
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.critical(
                 self, "Import Error",
                 f"Failed to import settings: {str(e)}"
             )
 
+    def _on_settings_imported(self, filename: str, ok: bool, settings):
+        """Apply settings read by a background import"""
+        self.status_label.setText("Settings imported" if ok else "Settings import failed")
+        if not ok:
+            QMessageBox.critical(
+                self, "Import Error",
+                f"Failed to import settings: {str(settings)}"
+            )
+            return
+
+        # Apply imported settings
+        self.apply_new_settings(settings)
+
+        QMessageBox.information(
+            self, "Import Complete",
+            f"Settings imported from {filename}"
+        )
+
     def refresh_gestures(self):
         """Refresh the custom gesture models"""
         # Reload all gestures in the custom gesture manager
@@ -1050,178 +1248,174 @@ class MainWindow(QMainWindow):
         self.stop_button.setEnabled(False)
         self.status_label.setText("Webcam stopped")
         self.video_label.setText("Webcam feed will appear here")
-        self.gesture_label.setText("No gesture detected")
-
-    def update_frame(self, frame: np.ndarray, hand_landmarks: List):
+        self._set_gesture_label("No gesture detected", self._last_gesture_style)
+
+    def _set_gesture_label(self, text: str, style: str):
+        """Update the gesture label, touching Qt only when text or style changed"""
+        if text != self._last_gesture_text:
+            self.gesture_label.setText(text)
+            self._last_gesture_text = text
+        if style != self._last_gesture_style:
+            self.gesture_label.setStyleSheet(style)
+            self._last_gesture_style = style
+
+    def update_frame(self, image: QImage, hand_landmarks: List):
         """Update video frame and process gestures"""
-        # Convert frame to Qt format and display
-        rgb_image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb_image.shape
-        bytes_per_line = ch * w
-        qt_image = QImage(rgb_image.data, w, h, bytes_per_line, QImage.Format_RGB888)
-
-        # Scale image to fit label
-        pixmap = QPixmap.fromImage(qt_image)
-        scaled_pixmap = pixmap.scaled(self.video_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.video_label.setPixmap(scaled_pixmap)
+        # Frames arrive as BGR888 QImages already scaled to the label size by the webcam thread
+        self.video_label.setPixmap(QPixmap.fromImage(image))
 
         # Update hands detected count
-        self.hands_label.setText(f"Hands detected: {len(hand_landmarks)}")
+        hands_count = len(hand_landmarks)
+        if hands_count != self._last_hands_count:
+            self.hands_label.setText(f"Hands detected: {hands_count}")
+            self._last_hands_count = hands_count
 
         # Process gesture recognition (GFLOW-17: Check if recognition is enabled)
-        if hand_landmarks and self.recognition_enabled:
-            start_recognition = time.time()
+        if not self.recognition_enabled:
+            # The webcam thread skips hand detection while disabled, so no landmarks arrive
+            self._set_gesture_label("Recognition disabled", self._LABEL_QSS_GRAY)
+        elif hand_landmarks:
+            start_recognition_ns = time.perf_counter_ns()
 
             # Process first detected hand
             gesture, gesture_type = self.gesture_recognizer.recognize_gesture(hand_landmarks[0])
 
-            recognition_time = (time.time() - start_recognition) * 1000  # Convert to ms
-            self.recognition_times.append(recognition_time)
+            recognition_time = (time.perf_counter_ns() - start_recognition_ns) / 1e6  # Convert to ms
+            if len(self._recent_latencies) == self._recent_latencies.maxlen:
+                self._recent_latency_sum -= self._recent_latencies[0]
+            self._recent_latencies.append(recognition_time)
+            self._recent_latency_sum += recognition_time
 
             # GFLOW-E04: Dynamic mouse control while holding a gesture (process every frame)
-            self._process_mouse_control(hand_landmarks[0], gesture, gesture_type)
+            if self._mouse_control_enabled:
+                self._process_mouse_control(hand_landmarks[0], gesture, gesture_type)
 
             if gesture:
-                if gesture_type == 'predefined':
-                    gesture_name = self.gesture_recognizer.gesture_names.get(gesture, gesture)
-                    self.gesture_label.setText(f"Detected: {gesture_name}")
-                    self.gesture_label.setStyleSheet("color: green; font-weight: bold;")
-                elif gesture_type == 'custom':
-                    self.gesture_label.setText(f"Custom: {gesture}")
-                    self.gesture_label.setStyleSheet("color: purple; font-weight: bold;")
+                display = self._gesture_display[gesture_type].get(gesture)
+                if display is None:
+                    if gesture_type == 'predefined':
+                        display = (f"Detected: {gesture}", self._LABEL_QSS_GREEN)
+                    else:
+                        display = (f"Custom: {gesture}", self._LABEL_QSS_PURPLE)
+                    self._gesture_display[gesture_type][gesture] = display
+                self._set_gesture_label(*display)
 
                 # Execute action if mapped (GFLOW-E03)
                 self.execute_gesture_action(gesture, gesture_type)
             else:
-                self.gesture_label.setText("Hand detected - No gesture")
-                self.gesture_label.setStyleSheet("color: orange; font-weight: bold;")
-        elif hand_landmarks and not self.recognition_enabled:
-            # Show that hands are detected but recognition is disabled
-            self.gesture_label.setText("Hand detected - Recognition disabled")
-            self.gesture_label.setStyleSheet("color: gray; font-weight: bold;")
+                self._set_gesture_label("Hand detected - No gesture", self._LABEL_QSS_ORANGE)
         else:
-            if self.recognition_enabled:
-                self.gesture_label.setText("No gesture detected")
-                self.gesture_label.setStyleSheet("color: blue; font-weight: bold;")
-            else:
-                self.gesture_label.setText("Recognition disabled")
-                self.gesture_label.setStyleSheet("color: gray; font-weight: bold;")
+            self._set_gesture_label("No gesture detected", self._LABEL_QSS_BLUE)
 
         # Update performance metrics (GFLOW-4)
         self.frame_count += 1
-        if self.recognition_times:
-            # Keep only recent recognition times
-            max_history = PERFORMANCE_CONFIG['max_recognition_history']
-            if len(self.recognition_times) > max_history:
-                self.recognition_times = self.recognition_times[-max_history:]
-
+        # Refresh the label at ~2 Hz (every 15 frames) rather than repainting every frame
+        if self._recent_latencies and self.frame_count % 15 == 0:
             # Calculate average latency from recent measurements
-            recent_times = self.recognition_times[-30:] if len(self.recognition_times) >= 30 else self.recognition_times
-            avg_latency = sum(recent_times) / len(recent_times)
-
-            self.perf_label.setText(
-                f"Recognition latency: {avg_latency:.1f} ms\n"
-                f"Frames processed: {self.frame_count}"
-            )
+            avg_latency = self._recent_latency_sum / len(self._recent_latencies)
+            self.perf_label.setText(self._PERF_FMT(avg_latency, self.frame_count))
+
+    def _update_mouse_control_settings(self):
+        """GFLOW-E04: Rebuild the mouse control snapshot after MOUSE_CONTROL_CONFIG changes"""
+        self._mouse_cfg = MouseControlSettings.from_config(MOUSE_CONTROL_CONFIG)
+        self._mouse_control_enabled = self._mouse_cfg.enabled
+        if not self._mouse_control_enabled:
+            # Reset state here since the per-frame path is skipped while disabled
+            self.mouse_control_active = False
+            self.mouse_activation_counter = 0
+            self.prev_ref_point = None
+            self.prev_delta = (0.0, 0.0)
 
     def _process_mouse_control(self, landmarks: List[Tuple[float, float, float]], detected_gesture: Optional[str], detected_type: str):
         """While the configured gesture is held, move the OS mouse cursor following hand movement.
         Uses chosen landmark and applies deadzone, sensitivity, and smoothing.
+        Only called while mouse control is enabled (see _update_mouse_control_settings).
         """
-        try:
-            cfg = MOUSE_CONTROL_CONFIG
-            if not cfg.get('enabled', True):
-                # Reset state
-                self.mouse_control_active = False
-                self.mouse_activation_counter = 0
-                self.prev_ref_point = None
-                self.prev_delta = (0.0, 0.0)
-                return
+        cfg = self._mouse_cfg
 
-            # Check if current detection matches configured activation gesture
-            match = (detected_gesture == cfg.get('gesture_name') and
-                     detected_type == cfg.get('gesture_type'))
+        # Check if current detection matches configured activation gesture
+        match = (detected_gesture == cfg.gesture_name and
+                 detected_type == cfg.gesture_type)
 
-            if match:
-                self.mouse_activation_counter += 1
-                self.mouse_deactivation_counter = 0
-            else:
-                self.mouse_deactivation_counter += 1
-                self.mouse_activation_counter = 0
-
-            # Update active state with hysteresis
-            if not self.mouse_control_active and self.mouse_activation_counter >= cfg.get('activation_frames', 3):
-                self.mouse_control_active = True
-                # Reset reference when activating to avoid jump
-                self.prev_ref_point = None
-                self.prev_delta = (0.0, 0.0)
-            elif self.mouse_control_active and self.mouse_deactivation_counter >= cfg.get('deactivation_frames', 2):
-                self.mouse_control_active = False
-                self.prev_ref_point = None
-                self.prev_delta = (0.0, 0.0)
-
-            if not self.mouse_control_active:
-                return
+        if match:
+            self.mouse_activation_counter += 1
+            self.mouse_deactivation_counter = 0
+        else:
+            self.mouse_deactivation_counter += 1
+            self.mouse_activation_counter = 0
+
+        # Update active state with hysteresis
+        if not self.mouse_control_active and self.mouse_activation_counter >= cfg.activation_frames:
+            self.mouse_control_active = True
+            # Reset reference when activating to avoid jump
+            self.prev_ref_point = None
+            self.prev_delta = (0.0, 0.0)
+        elif self.mouse_control_active and self.mouse_deactivation_counter >= cfg.deactivation_frames:
+            self.mouse_control_active = False
+            self.prev_ref_point = None
+            self.prev_delta = (0.0, 0.0)
+
+        if not self.mouse_control_active:
+            return
 
-            # Pick reference landmark (normalized coords in [0,1])
-            idx_map = {
-                'wrist': 0,
-                'index_tip': 8
-            }
-            lm_index = idx_map.get(cfg.get('landmark', 'index_tip'), 8)
-            if lm_index < 0 or lm_index >= len(landmarks):
-                return
-            ref_x, ref_y, _ = landmarks[lm_index]
+        # Pick reference landmark (normalized coords in [0,1])
+        lm_index = cfg.landmark_idx
+        if lm_index >= len(landmarks):
+            return
+        ref_x, ref_y, _ = landmarks[lm_index]
 
-            # Convert normalized movement to pixel delta relative to previous point
-            # Use video widget size as movement reference, then let ActionExecutor clamp to screen
-            video_w = self.video_label.width()
-            video_h = self.video_label.height()
-            cur_px = (ref_x * video_w, ref_y * video_h)
+        # Convert normalized movement to pixel delta relative to previous point
+        # Use video widget size as movement reference, then let ActionExecutor clamp to screen
+        video_w = self.video_label.width()
+        video_h = self.video_label.height()
+        cur_px = (ref_x * video_w, ref_y * video_h)
 
-            if self.prev_ref_point is None:
-                self.prev_ref_point = cur_px
-                return
+        if self.prev_ref_point is None:
+            self.prev_ref_point = cur_px
+            return
 
-            dx = cur_px[0] - self.prev_ref_point[0]
-            dy = cur_px[1] - self.prev_ref_point[1]
-
-            # Invert axes if configured
-            if cfg.get('invert_x', False):
-                dx = -dx
-            if cfg.get('invert_y', False):
-                dy = -dy
-
-            # Apply deadzone (Euclidean radius)
-            dead = float(cfg.get('deadzone_pixels', 3))
-            if math.hypot(dx, dy) < dead:
-                dx, dy = 0.0, 0.0
-
-            # Sensitivity gain
-            gain = float(cfg.get('sensitivity', 1.5))
-            dx *= gain
-            dy *= gain
-
-            # Smoothing via exponential moving average on delta
-            alpha = float(cfg.get('smoothing', 0.5))  # 0=no smoothing, 1=heavy
-            if alpha > 0.0:
-                smoothed_dx = (1 - alpha) * dx + alpha * self.prev_delta[0]
-                smoothed_dy = (1 - alpha) * dy + alpha * self.prev_delta[1]
-            else:
-                smoothed_dx, smoothed_dy = dx, dy
+        dx = cur_px[0] - self.prev_ref_point[0]
+        dy = cur_px[1] - self.prev_ref_point[1]
+
+        # Invert axes if configured
+        if cfg.invert_x:
+            dx = -dx
+        if cfg.invert_y:
+            dy = -dy
+
+        # Apply deadzone (Euclidean radius, compared squared to avoid the sqrt)
+        if dx * dx + dy * dy < cfg.deadzone_sq:
+            dx, dy = 0.0, 0.0
+
+        # Sensitivity gain
+        gain = cfg.gain
+        dx *= gain
+        dy *= gain
+
+        # Smoothing via exponential moving average on delta
+        alpha = cfg.alpha  # 0=no smoothing, 1=heavy
+        if alpha > 0.0:
+            smoothed_dx = (1 - alpha) * dx + alpha * self.prev_delta[0]
+            smoothed_dy = (1 - alpha) * dy + alpha * self.prev_delta[1]
+        else:
+            smoothed_dx, smoothed_dy = dx, dy
 
-            self.prev_delta = (smoothed_dx, smoothed_dy)
-            self.prev_ref_point = cur_px
+        self.prev_delta = (smoothed_dx, smoothed_dy)
+        self.prev_ref_point = cur_px
 
-            # Apply movement via action executor immediate utility (no queue)
+        # Apply movement via action executor immediate utility (no queue)
+        try:
             self.action_executor.move_cursor_relative(smoothed_dx, smoothed_dy)
         except Exception as e:
             # Avoid crashing the UI loop due to unexpected errors
             print(f"Mouse control error: {e}")
 
     def update_fps(self, fps: float):
-        """Update FPS display"""
-        self.fps_label.setText(f"FPS: {fps:.1f}")
+        """Update FPS display (emitted every fps_update_interval frames)"""
+        text = f"FPS: {fps:.1f}"
+        if text != self._fps_text:
+            self.fps_label.setText(text)
+            self._fps_text = text
 
     def handle_error(self, error_message: str):
         """Handle errors from webcam thread"""
@@ -1231,18 +1425,22 @@ class MainWindow(QMainWindow):
 
     def open_action_mapping_dialog(self):
         """Open the action mapping dialog"""
-        dialog = ActionMappingDialog(
-            self.action_mapping_manager,
-            self.custom_gesture_manager,
-            self.profile_manager,  # GFLOW-18: Pass unified profile manager
-            self
-        )
-        dialog.exec()
+        if self._action_mapping_dialog is None:
+            self._action_mapping_dialog = ActionMappingDialog(
+                self.action_mapping_manager,
+                self.custom_gesture_manager,
+                self.profile_manager,  # GFLOW-18: Pass unified profile manager
+                self
+            )
+        else:
+            # Gestures or mappings may have changed (e.g. profile switch) since last open
+            self._action_mapping_dialog.refresh_for_profile_change()
+
+        self._action_mapping_dialog.exec()
 
     def emergency_stop_actions(self):
         """Emergency stop all action execution"""
         self.action_executor.emergency_stop_all()
-        from PySide6.QtWidgets import QMessageBox
         QMessageBox.information(
             self, "Emergency Stop",
             "All action execution has been stopped.\nUse 'Resume Actions' to continue."
@@ -1251,7 +1449,6 @@ class MainWindow(QMainWindow):
     def resume_actions(self):
         """Resume action execution"""
         self.action_executor.resume_execution()
-        from PySide6.QtWidgets import QMessageBox
         QMessageBox.information(
             self, "Actions Resumed",
             "Action execution has been resumed."
@@ -1261,9 +1458,10 @@ class MainWindow(QMainWindow):
         """Execute action mapped to a gesture"""
         try:
             # Prevent rapid repeated execution of the same gesture
-            current_time = time.time()
+            # (monotonic clock, so wall-clock adjustments can't cause double execution)
+            now_ns = time.monotonic_ns()
             if (self.last_executed_gesture == gesture and
-                current_time - self.last_execution_time < 1.0):  # 1 second cooldown
+                now_ns - self.last_execution_time_ns < self._cooldown_ns):
                 return
 
             # Get mapping for the gesture
@@ -1275,7 +1473,7 @@ class MainWindow(QMainWindow):
             self.action_mapping_manager.record_action_usage(mapping.id)
 
             # GFLOW-19: Show gesture recognition notification
-            if hasattr(self, 'notification_manager'):
+            if self._has_notifications:
                 action_description = f"{mapping.action.type.value}.{mapping.action.subtype}"
                 self.notification_manager.show_gesture_recognized(gesture, gesture_type, action_description)
 
@@ -1284,7 +1482,7 @@ class MainWindow(QMainWindow):
 
             # Update tracking
             self.last_executed_gesture = gesture
-            self.last_execution_time = current_time
+            self.last_execution_time_ns = now_ns
 
         except Exception as e:
             print(f"Error executing gesture action: {e}")
@@ -1294,7 +1492,7 @@ class MainWindow(QMainWindow):
         print(f"Action executed successfully: {action.type.value}.{action.subtype}")
 
         # GFLOW-19: Show visual notification
-        if hasattr(self, 'notification_manager'):
+        if self._has_notifications:
             action_description = f"{action.type.value}.{action.subtype}"
             self.notification_manager.show_action_executed(action_description, success=True)
 
@@ -1303,10 +1501,17 @@ class MainWindow(QMainWindow):
         print(f"Action execution failed: {action.type.value}.{action.subtype} - {result.message}")
 
         # GFLOW-19: Show visual notification for failure
-        if hasattr(self, 'notification_manager'):
+        if self._has_notifications:
             action_description = f"{action.type.value}.{action.subtype}"
             self.notification_manager.show_action_executed(f"{action_description} (Failed)", success=False)
 
+    def eventFilter(self, obj, event):
+        """Keep the webcam thread's frame scaling in sync with the video label size"""
+        if obj is self.video_label and event.type() == QEvent.Resize:
+            size = event.size()
+            self.webcam_thread.set_target_size(size.width(), size.height())
+        return super().eventFilter(obj, event)
+
     def closeEvent(self, event):
         """Handle application close"""
         # Shutdown action execution components
@@ -5,14 +5,83 @@ Provides non-intrusive visual notifications for gesture recognition events.
 Features fade-in/fade-out animations and customizable positioning.
 """
 
-import time
-from typing import Optional, Tuple
-from PySide6.QtWidgets import QLabel, QWidget, QGraphicsOpacityEffect
-from PySide6.QtCore import QTimer, QPropertyAnimation, QEasingCurve, QRect, Qt, Signal
-from PySide6.QtGui import QFont, QPalette
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from PySide6.QtWidgets import QLabel, QWidget
+from PySide6.QtCore import QTimer, QPropertyAnimation, QAbstractAnimation, QEasingCurve, QPoint, QSize, QEvent, Qt, Signal, Slot, QMetaObject
+from PySide6.QtGui import QFont
 from config import VISUAL_FEEDBACK_CONFIG
 
 
+# Config keys feeding the notification stylesheet, in _build_style argument order
+_STYLE_KEYS = (
+    'notification_background_color', 'notification_text_color',
+    'notification_border_width', 'notification_border_color',
+    'notification_border_radius', 'notification_padding',
+    'notification_font_weight', 'notification_font_size',
+)
+
+# Display names for predefined gesture ids
+_READABLE_NAMES = {
+    'open_palm': 'Open Palm',
+    'fist': 'Fist',
+    'thumbs_up': 'Thumbs Up',
+    'peace_sign': 'Peace Sign',
+    'pointing': 'Pointing'
+}
+
+# Longest action description shown before truncating (ellipsis included)
+_MAX_ACTION_LEN = 30
+_ELLIPSIS = "…"
+
+# Notification message templates
+_MSG_RECOGNIZED = "Gesture: %s\n→ Action: %s"
+_MSG_DETECTED = "Gesture Detected: %s"
+_MSG_ACTION_OK = "✓ Action: %s"
+_MSG_ACTION_FAIL = "✗ Action: %s"
+
+# Position name -> (anchored right, anchored bottom); unknown names fall back to top_right
+_POSITION_ANCHORS = {
+    'top_left': (False, False),
+    'top_right': (True, False),
+    'bottom_left': (False, True),
+    'bottom_right': (True, True),
+}
+
+
+@lru_cache(maxsize=4)
+def _build_style(background_color, text_color, border_width, border_color,
+                 border_radius, padding, font_weight, font_size) -> str:
+    """Build the notification stylesheet (cached, so Qt only reparses on config changes)"""
+    return f"""
+        QLabel {{
+            background-color: {background_color};
+            color: {text_color};
+            border: {border_width}px solid {border_color};
+            border-radius: {border_radius}px;
+            padding: {padding}px;
+            font-weight: {font_weight};
+            font-size: {font_size}px;
+        }}
+        """
+
+
+@lru_cache(maxsize=128)
+def _titleize(gesture_name: str) -> str:
+    """Readable fallback name for gesture ids not in _READABLE_NAMES"""
+    return gesture_name.replace('_', ' ').title()
+
+
+@lru_cache(maxsize=4)
+def _build_font(point_size: int, bold: bool) -> QFont:
+    """Build the notification font (built lazily, QFont needs a running QApplication)"""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(bold)
+    return font
+
+
 class NotificationWidget(QLabel):
     """
     Custom notification widget for displaying gesture recognition feedback
@@ -34,19 +103,38 @@ class NotificationWidget(QLabel):
         # Configuration
         self.config = VISUAL_FEEDBACK_CONFIG
         
-        # Animation and timing
-        self.opacity_effect = QGraphicsOpacityEffect()
-        self.setGraphicsEffect(self.opacity_effect)
-        self.fade_animation = QPropertyAnimation(self.opacity_effect, b"opacity")
-        self.hide_timer = QTimer()
+        # Animation and timing (fade_animation is only built while animations are enabled)
+        self.fade_animation: Optional[QPropertyAnimation] = None
+        self.hide_timer = QTimer(self)
         self.hide_timer.setSingleShot(True)
         
         # State tracking
         self.is_showing = False
-        self.notification_queue = []
+        # Pending message -> [duration, repeat count]; repeats are merged, not queued
+        self.notification_queue: OrderedDict = OrderedDict()
+        self._current_message: Optional[str] = None
+        self._current_count = 0
+        # Dequeued (message, duration, count) waiting for the next event loop pass
+        self._next_pending: Optional[Tuple[str, Optional[float], int]] = None
+        
+        # Geometry of the last shown text, to skip relayout/moves when unchanged
+        self._last_text_size: Optional[QSize] = None
+        self._last_pos: Optional[QPoint] = None
+        # Parent-relative (x, y) per layout key; cleared when the parent resizes
+        # or it or its window moves
+        self._pos_cache: Dict[tuple, Tuple[int, int]] = {}
+        # Top-level window holding the parent; moving it moves the anchor on screen
+        self._parent_window: Optional[QWidget] = None
+        if parent is not None:
+            parent.installEventFilter(self)
+            window = parent.window()
+            if window is not parent:
+                self._parent_window = window
+                window.installEventFilter(self)
         
         # Setup widget
         self._setup_widget()
+        self.apply_config()
         self._setup_animations()
         self._connect_signals()
         
@@ -55,43 +143,54 @@ class NotificationWidget(QLabel):
     
     def _setup_widget(self):
         """Setup widget appearance and properties"""
-        # Widget properties
-        self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
+        # Widget properties: a frameless tool window (owned by the parent's
+        # window) so windowOpacity applies; Qt.Tool keeps it above its owner
+        # only, and it never takes focus from the app
+        self.setWindowFlags(Qt.Tool | Qt.FramelessWindowHint | Qt.WindowDoesNotAcceptFocus)
         self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setAttribute(Qt.WA_ShowWithoutActivating)
         self.setAlignment(Qt.AlignCenter)
         self.setWordWrap(True)
+    
+    def apply_config(self):
+        """Re-read VISUAL_FEEDBACK_CONFIG (call after it changes)
+        Values used on every notification are copied to attributes so the
+        hot path avoids repeated dict lookups.
+        """
+        config = self.config
+        self._show_enabled = config['show_gesture_notifications']
+        self._anim_enabled = config['enable_notification_animations']
+        self._fade_in_ms = config['fade_in_duration']
+        self._fade_out_ms = config['fade_out_duration']
+        self._hold_s = config['notification_duration']
+        self._max_queue = config['max_notifications_queue']
+        self._anchor = _POSITION_ANCHORS.get(config['notification_position'], (True, False))
+        self._off_x = config['notification_offset_x']
+        self._off_y = config['notification_offset_y']
+        self._pos_cache.clear()
         
         # Styling
         self._apply_styling()
         
         # Font
-        font = QFont()
-        font.setPointSize(self.config['notification_font_size'])
-        font.setBold(self.config['notification_font_weight'] == 'bold')
-        self.setFont(font)
+        self.setFont(_build_font(config['notification_font_size'],
+                                 config['notification_font_weight'] == 'bold'))
+        self._last_text_size = None
     
     def _apply_styling(self):
         """Apply CSS styling to the notification"""
-        style = f"""
-        QLabel {{
-            background-color: {self.config['notification_background_color']};
-            color: {self.config['notification_text_color']};
-            border: {self.config['notification_border_width']}px solid {self.config['notification_border_color']};
-            border-radius: {self.config['notification_border_radius']}px;
-            padding: {self.config['notification_padding']}px;
-            font-weight: {self.config['notification_font_weight']};
-            font-size: {self.config['notification_font_size']}px;
-        }}
-        """
-        self.setStyleSheet(style)
+        config = self.config
+        self.setStyleSheet(_build_style(*[config[key] for key in _STYLE_KEYS]))
     
     def _setup_animations(self):
         """Setup fade animations"""
-        if not self.config['enable_notification_animations']:
+        if not self._anim_enabled or self.fade_animation is not None:
             return
             
-        # Fade animation setup
-        self.fade_animation.setDuration(self.config['fade_in_duration'])
+        # Fade animation setup; windowOpacity is blended by the window compositor,
+        # unlike a QGraphicsOpacityEffect which re-rasterizes the label on every tick
+        self.fade_animation = QPropertyAnimation(self, b"windowOpacity")
+        self.fade_animation.setDuration(self._fade_in_ms)
         self.fade_animation.setEasingCurve(QEasingCurve.InOutQuad)
         
         # Animation finished handler
@@ -109,39 +208,68 @@ class NotificationWidget(QLabel):
             message: Text to display
             duration: How long to show (uses config default if None)
         """
-        if not self.config['show_gesture_notifications']:
+        if not self._show_enabled:
             return
             
         # Queue management
         if self.is_showing:
-            if len(self.notification_queue) < self.config['max_notifications_queue']:
-                self.notification_queue.append((message, duration))
+            if message == self._current_message:
+                # Same message still on screen: bump its counter and keep it up
+                self._current_count += 1
+                self._set_message_text(self._format_count(message, self._current_count))
+                if not self.hide_timer.isActive():
+                    # Repeat arrived during fade-out: cancel it and show fully again
+                    if self.fade_animation is not None:
+                        self.fade_animation.stop()
+                    self.setWindowOpacity(1.0)
+                self.hide_timer.start(int((duration or self._hold_s) * 1000))
+            elif message in self.notification_queue:
+                pending = self.notification_queue[message]
+                pending[0] = duration
+                pending[1] += 1
+            elif self._max_queue > 0:
+                # Bounded like deque(maxlen): overflow drops the oldest entry (O(1)),
+                # so the most recent gestures are the ones that get shown
+                if len(self.notification_queue) >= self._max_queue:
+                    self.notification_queue.popitem(last=False)
+                self.notification_queue[message] = [duration, 1]
             return
         
         self._display_notification(message, duration)
     
-    def _display_notification(self, message: str, duration: Optional[float] = None):
+    @staticmethod
+    def _format_count(message: str, count: int) -> str:
+        """Append a repeat counter to a message shown more than once"""
+        return f"{message} ×{count}" if count > 1 else message
+    
+    def _display_notification(self, message: str, duration: Optional[float] = None, count: int = 1):
         """Internal method to display a notification"""
-        # Set message and adjust size
-        self.setText(message)
-        self.adjustSize()
+        self._current_message = message
+        self._current_count = count
         
-        # Position the notification
-        self._position_notification()
+        # Set message, adjust size and position
+        self._set_message_text(self._format_count(message, count))
         
         # Show and start fade-in
         self.is_showing = True
-        self.show()
+        if not self.isVisible():
+            self.show()
         
-        if self.config['enable_notification_animations']:
-            self._start_fade_in()
-        else:
-            self.opacity_effect.setOpacity(1.0)
+        self._start_fade_in()
         
         # Set hide timer
-        hide_duration = duration or self.config['notification_duration']
+        hide_duration = duration or self._hold_s
         self.hide_timer.start(int(hide_duration * 1000))
     
+    def _set_message_text(self, text: str):
+        """Set the label text, only re-fitting the widget when the text size changes"""
+        self.setText(text)
+        text_size = self.fontMetrics().size(0, text)
+        if text_size != self._last_text_size:
+            self.adjustSize()
+            self._last_text_size = text_size
+        self._position_notification()
+    
     def _position_notification(self):
         """Position the notification based on configuration"""
         if not self.parent():
@@ -150,41 +278,51 @@ class NotificationWidget(QLabel):
         parent_rect = self.parent().rect()
         notification_size = self.size()
         
-        # Calculate position based on configuration
-        position = self.config['notification_position']
-        offset_x = self.config['notification_offset_x']
-        offset_y = self.config['notification_offset_y']
+        key = (parent_rect.width(), parent_rect.height(),
+               notification_size.width(), notification_size.height())
+        cached = self._pos_cache.get(key)
+        if cached is None:
+            # Calculate position based on configuration
+            right, bottom = self._anchor
+            x, y = self._off_x, self._off_y
+            if right:
+                x = key[0] - key[2] - x
+            if bottom:
+                y = key[1] - key[3] - y
+            cached = self._pos_cache[key] = (x, y)
         
-        if position == 'top_left':
-            x = offset_x
-            y = offset_y
-        elif position == 'top_right':
-            x = parent_rect.width() - notification_size.width() - offset_x
-            y = offset_y
-        elif position == 'bottom_left':
-            x = offset_x
-            y = parent_rect.height() - notification_size.height() - offset_y
-        elif position == 'bottom_right':
-            x = parent_rect.width() - notification_size.width() - offset_x
-            y = parent_rect.height() - notification_size.height() - offset_y
-        else:
-            # Default to top_right
-            x = parent_rect.width() - notification_size.width() - offset_x
-            y = offset_y
-        
-        self.move(x, y)
+        # Top-level window, so convert from parent to screen coordinates
+        pos = self.parent().mapToGlobal(QPoint(*cached))
+        if pos != self._last_pos:
+            self.move(pos)
+            self._last_pos = pos
+    
+    def eventFilter(self, obj, event):
+        """Follow the parent when it (or its window) is resized or moved"""
+        if ((obj is self.parent() or obj is self._parent_window)
+                and event.type() in (QEvent.Resize, QEvent.Move)):
+            self._pos_cache.clear()
+            if self.is_showing:
+                self._position_notification()
+        return super().eventFilter(obj, event)
     
     def _start_fade_in(self):
-        """Start fade-in animation"""
-        self.fade_animation.setDuration(self.config['fade_in_duration'])
+        """Start fade-in animation (or show fully opaque if animations are disabled)"""
+        if not self._anim_enabled:
+            self.setWindowOpacity(1.0)
+            return
+        # Animations may have been enabled from settings after construction
+        self._setup_animations()
+        self.fade_animation.setDuration(self._fade_in_ms)
         self.fade_animation.setStartValue(0.0)
         self.fade_animation.setEndValue(1.0)
         self.fade_animation.start()
     
     def _start_fade_out(self):
         """Start fade-out animation"""
-        if self.config['enable_notification_animations']:
-            self.fade_animation.setDuration(self.config['fade_out_duration'])
+        if self._anim_enabled:
+            self._setup_animations()
+            self.fade_animation.setDuration(self._fade_out_ms)
             self.fade_animation.setStartValue(1.0)
             self.fade_animation.setEndValue(0.0)
             self.fade_animation.start()
@@ -193,20 +331,40 @@ class NotificationWidget(QLabel):
     
     def _on_animation_finished(self):
         """Handle animation completion"""
-        if self.opacity_effect.opacity() == 0.0:
+        if self.windowOpacity() == 0.0:
             self._hide_notification()
     
     def _hide_notification(self):
         """Hide the notification and process queue"""
-        self.hide()
+        if self.isVisible():
+            self.hide()
         self.is_showing = False
         self.notification_hidden.emit()
         
-        # Process next notification in queue
-        if self.notification_queue:
-            message, duration = self.notification_queue.pop(0)
-            # Small delay before showing next notification
-            QTimer.singleShot(100, lambda: self._display_notification(message, duration))
+        # Process next notification in queue, skipping a repeat of the one just hidden
+        hidden_message = self._current_message
+        self._current_message = None
+        while self.notification_queue:
+            message, (duration, count) = self.notification_queue.popitem(last=False)
+            if message != hidden_message:
+                # Show the next notification on the next event loop pass
+                self._next_pending = (message, duration, count)
+                QMetaObject.invokeMethod(self, "_display_pending", Qt.QueuedConnection)
+                break
+    
+    @Slot()
+    def _display_pending(self):
+        """Display the notification dequeued by _hide_notification"""
+        pending, self._next_pending = self._next_pending, None
+        if pending is None:
+            return
+        if self.is_showing:
+            # Another notification got in first; put this one back at the head
+            message, duration, count = pending
+            self.notification_queue[message] = [duration, count]
+            self.notification_queue.move_to_end(message, last=False)
+            return
+        self._display_notification(*pending)
     
     def clear_queue(self):
         """Clear all queued notifications"""
@@ -215,7 +373,8 @@ class NotificationWidget(QLabel):
     def force_hide(self):
         """Immediately hide the notification"""
         self.hide_timer.stop()
-        self.fade_animation.stop()
+        if self.fade_animation is not None and self.fade_animation.state() != QAbstractAnimation.Stopped:
+            self.fade_animation.stop()
         self._hide_notification()
 
 
@@ -242,9 +401,7 @@ class GestureNotificationManager:
         gesture_display = self._format_gesture_name(gesture_name, gesture_type)
         action_display = self._format_action_description(action_description)
         
-        message = f"Gesture: {gesture_display}\n→ Action: {action_display}"
-        
-        self.notification_widget.show_notification(message)
+        self.notification_widget.show_notification(_MSG_RECOGNIZED % (gesture_display, action_display))
     
     def show_gesture_detected(self, gesture_name: str, gesture_type: str):
         """
@@ -255,9 +412,8 @@ class GestureNotificationManager:
             gesture_type: Type of gesture (predefined/custom)
         """
         gesture_display = self._format_gesture_name(gesture_name, gesture_type)
-        message = f"Gesture Detected: {gesture_display}"
         
-        self.notification_widget.show_notification(message, duration=1.0)
+        self.notification_widget.show_notification(_MSG_DETECTED % gesture_display, duration=1.0)
     
     def show_action_executed(self, action_description: str, success: bool = True):
         """
@@ -267,30 +423,20 @@ class GestureNotificationManager:
             action_description: Description of the executed action
             success: Whether the action was successful
         """
-        status = "✓" if success else "✗"
-        message = f"{status} Action: {action_description}"
+        template = _MSG_ACTION_OK if success else _MSG_ACTION_FAIL
         
-        self.notification_widget.show_notification(message, duration=1.5)
+        self.notification_widget.show_notification(template % action_description, duration=1.5)
     
     def _format_gesture_name(self, gesture_name: str, gesture_type: str) -> str:
         """Format gesture name for display"""
         if gesture_type == 'custom':
             return f"{gesture_name} (Custom)"
-        else:
-            # Convert predefined gesture IDs to readable names
-            readable_names = {
-                'open_palm': 'Open Palm',
-                'fist': 'Fist',
-                'thumbs_up': 'Thumbs Up',
-                'peace_sign': 'Peace Sign',
-                'pointing': 'Pointing'
-            }
-            return readable_names.get(gesture_name, gesture_name.replace('_', ' ').title())
+        # Convert predefined gesture IDs to readable names
+        return _READABLE_NAMES.get(gesture_name) or _titleize(gesture_name)
     
     def _format_action_description(self, action_description: str) -> str:
         """Format action description for display"""
         # Truncate long descriptions
-        max_length = 30
-        if len(action_description) > max_length:
-            return action_description[:max_length-3] + "..."
-        return action_description
+        if len(action_description) <= _MAX_ACTION_LEN:
+            return action_description
+        return action_description[:_MAX_ACTION_LEN - 1] + _ELLIPSIS
@@ -1,15 +1,26 @@
 import os
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache, partial
+from typing import Dict, Optional
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QListWidget,
     QListWidgetItem, QLabel, QPushButton, QLineEdit, QTextEdit,
     QGroupBox, QMessageBox, QFileDialog, QSplitter, QFrame,
-    QWidget, QScrollArea, QGridLayout
+    QWidget, QScrollArea, QGridLayout, QListView, QInputDialog
 )
-from PySide6.QtCore import Qt, Signal, QSize
-from PySide6.QtGui import QFont, QIcon, QPixmap
+from PySide6.QtCore import Qt, Signal, QSize, QTimer
+from PySide6.QtGui import QFont, QIcon, QPixmap, QBrush
 from profile_manager import ProfileManager, ProfileInfo
+from background_task import start_background_task
+
+
+@lru_cache(maxsize=512)
+def _fmt_iso(timestamp: str) -> str:
+    """Format an ISO timestamp for display, falling back to the raw string"""
+    try:
+        return datetime.fromisoformat(timestamp).strftime("%Y-%m-%d %H:%M")
+    except (ValueError, TypeError):
+        return timestamp
 
 
 class ProfileManagementDialog(QDialog):
@@ -22,10 +33,94 @@ class ProfileManagementDialog(QDialog):
     
     profile_changed = Signal(str)  # Emitted when profile is switched
     
+    # Dialog-wide button styles, parsed once and matched by object name
+    _QSS = """
+        QPushButton#backup, QPushButton#close, QPushButton#new_profile, QPushButton#delete_profile,
+        QPushButton#load_profile, QPushButton#set_default, QPushButton#export_profile,
+        QPushButton#import_profile {
+            color: white;
+            border: none;
+        }
+        QPushButton#backup, QPushButton#close {
+            padding: 8px 16px;
+            border-radius: 4px;
+        }
+        QPushButton#new_profile, QPushButton#delete_profile {
+            padding: 6px 12px;
+            border-radius: 3px;
+        }
+        QPushButton#load_profile, QPushButton#set_default, QPushButton#export_profile,
+        QPushButton#import_profile {
+            padding: 10px 20px;
+            border-radius: 5px;
+        }
+        QPushButton#close { min-width: 80px; }
+        QPushButton#load_profile { font-weight: bold; }
+        QPushButton#backup, QPushButton#set_default { background-color: #f39c12; }
+        QPushButton#backup:hover, QPushButton#set_default:hover { background-color: #e67e22; }
+        QPushButton#close, QPushButton#load_profile { background-color: #3498db; }
+        QPushButton#close:hover, QPushButton#load_profile:hover { background-color: #2980b9; }
+        QPushButton#new_profile { background-color: #27ae60; }
+        QPushButton#new_profile:hover { background-color: #229954; }
+        QPushButton#delete_profile { background-color: #e74c3c; }
+        QPushButton#delete_profile:hover { background-color: #c0392b; }
+        QPushButton#export_profile { background-color: #9b59b6; }
+        QPushButton#export_profile:hover { background-color: #8e44ad; }
+        QPushButton#import_profile { background-color: #16a085; }
+        QPushButton#import_profile:hover { background-color: #138d75; }
+        QLabel#status { color: #27ae60; }
+        QLabel#profile_status_active { color: #27ae60; font-weight: bold; }
+        QLabel#profile_status_inactive { color: #7f8c8d; }
+    """
+    
+    # (attribute, text, QSS object name, initially enabled) per button group
+    _FOOTER_BUTTONS = (
+        ("backup_button", "Create Backup", "backup", True),
+        ("close_button", "Close", "close", True),
+    )
+    _LIST_BUTTONS = (
+        ("new_profile_button", "New Profile", "new_profile", True),
+        ("delete_profile_button", "Delete", "delete_profile", False),
+    )
+    # Laid out two per row in the actions grid
+    _ACTION_BUTTONS = (
+        ("load_profile_button", "Load Profile", "load_profile", False),
+        ("set_default_button", "Set as Default", "set_default", False),
+        ("export_profile_button", "Export Profile", "export_profile", False),
+        ("import_profile_button", "Import Profile", "import_profile", True),
+    )
+    # (attribute, form label, placeholder text) for the details form
+    _DETAIL_ROWS = (
+        ("profile_name_label", "Name:", "No profile selected"),
+        ("profile_description_label", "Description:", "-"),
+        ("profile_created_label", "Created:", "-"),
+        ("profile_modified_label", "Last Modified:", "-"),
+        ("profile_gestures_label", "Custom Gestures:", "-"),
+        ("profile_mappings_label", "Action Mappings:", "-"),
+        ("profile_status_label", "Status:", "-"),
+    )
+    
     def __init__(self, profile_manager: ProfileManager, parent=None):
         super().__init__(parent)
         self.profile_manager = profile_manager
         self.current_profile_item = None
+        # Profiles from the last refresh, by name (avoids re-reading the store per selection)
+        self._profiles_by_name: Dict[str, ProfileInfo] = {}
+        # List rows by profile name, so refreshes only add/remove/restyle what changed
+        self._item_by_name: Dict[str, QListWidgetItem] = {}
+        # Set when a refresh was requested while hidden; performed on next show
+        self._refresh_pending = False
+        # Name/mtime of the profile shown in the details panel, to skip identical re-renders
+        self._last_rendered_profile: Optional[str] = None
+        self._last_rendered_mtime: Optional[str] = None
+        # Shared row styling, reused by every list item instead of built per item
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+        self._normal_font = QFont()
+        self._active_brush = QBrush(Qt.lightGray)
+        self._no_brush = QBrush()
+        # Object name last applied to profile_status_label (selects its QSS rule)
+        self._last_status_style = ""
         
         self.setWindowTitle("Profile Management - GestureFlow")
         self.setModal(True)
@@ -33,11 +128,12 @@ class ProfileManagementDialog(QDialog):
         
         self.setup_ui()
         self.setup_connections()
-        self.refresh_profile_list()
+        self._request_refresh()
     
     def setup_ui(self):
         """Setup the user interface"""
         layout = QVBoxLayout(self)
+        self.setStyleSheet(self._QSS)
         
         # Title
         title_label = QLabel("Gesture Profile Management")
@@ -61,45 +157,35 @@ class ProfileManagementDialog(QDialog):
         # Set splitter proportions
         splitter.setSizes([300, 600])
         
-        # Button layout
+        # Button layout: backup on the left, close on the right
         button_layout = QHBoxLayout()
-        
-        # Create backup button
-        self.backup_button = QPushButton("Create Backup")
-        self.backup_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f39c12;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #e67e22;
-            }
-        """)
-        button_layout.addWidget(self.backup_button)
-        
+        backup_button, close_button = self._make_buttons(self._FOOTER_BUTTONS)
+        button_layout.addWidget(backup_button)
+
+        # Inline success messages, cleared after a few seconds (errors stay modal)
+        self._status_label = QLabel("")
+        self._status_label.setObjectName("status")
+        button_layout.addWidget(self._status_label)
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(3000)
+        self._status_timer.timeout.connect(self._status_label.clear)
+
         button_layout.addStretch()
-        
-        # Standard buttons
-        self.close_button = QPushButton("Close")
-        self.close_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
-        button_layout.addWidget(self.close_button)
+        button_layout.addWidget(close_button)
         
         layout.addLayout(button_layout)
+
+    def _make_buttons(self, specs):
+        """Create buttons from (attribute, text, object name, enabled) specs"""
+        buttons = []
+        for attr, text, object_name, enabled in specs:
+            button = QPushButton(text)
+            button.setObjectName(object_name)
+            button.setEnabled(enabled)
+            setattr(self, attr, button)
+            buttons.append(button)
+        return buttons
     
     def create_profile_list_panel(self, parent):
         """Create the profile list panel"""
@@ -115,41 +201,16 @@ class ProfileManagementDialog(QDialog):
         # Profile list
         self.profile_list = QListWidget()
         self.profile_list.setMinimumWidth(280)
+        # All rows share one layout: compute a single size hint and lay out in batches
+        self.profile_list.setUniformItemSizes(True)
+        self.profile_list.setLayoutMode(QListView.Batched)
+        self.profile_list.setBatchSize(100)
         left_layout.addWidget(self.profile_list)
         
         # Profile list buttons
         list_button_layout = QHBoxLayout()
-        
-        self.new_profile_button = QPushButton("New Profile")
-        self.new_profile_button.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                padding: 6px 12px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #229954;
-            }
-        """)
-        list_button_layout.addWidget(self.new_profile_button)
-        
-        self.delete_profile_button = QPushButton("Delete")
-        self.delete_profile_button.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                padding: 6px 12px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-        """)
-        self.delete_profile_button.setEnabled(False)
-        list_button_layout.addWidget(self.delete_profile_button)
+        for button in self._make_buttons(self._LIST_BUTTONS):
+            list_button_layout.addWidget(button)
         
         left_layout.addLayout(list_button_layout)
         
@@ -165,106 +226,20 @@ class ProfileManagementDialog(QDialog):
         details_group = QGroupBox("Profile Details")
         details_layout = QFormLayout(details_group)
         
-        # Profile name
-        self.profile_name_label = QLabel("No profile selected")
+        for attr, row_label, placeholder in self._DETAIL_ROWS:
+            label = QLabel(placeholder)
+            setattr(self, attr, label)
+            details_layout.addRow(row_label, label)
         self.profile_name_label.setFont(QFont("Arial", 14, QFont.Bold))
-        details_layout.addRow("Name:", self.profile_name_label)
-        
-        # Profile description
-        self.profile_description_label = QLabel("-")
         self.profile_description_label.setWordWrap(True)
-        details_layout.addRow("Description:", self.profile_description_label)
-        
-        # Profile statistics
-        self.profile_created_label = QLabel("-")
-        details_layout.addRow("Created:", self.profile_created_label)
-        
-        self.profile_modified_label = QLabel("-")
-        details_layout.addRow("Last Modified:", self.profile_modified_label)
-        
-        self.profile_gestures_label = QLabel("-")
-        details_layout.addRow("Custom Gestures:", self.profile_gestures_label)
-        
-        self.profile_mappings_label = QLabel("-")
-        details_layout.addRow("Action Mappings:", self.profile_mappings_label)
-        
-        # Profile status
-        self.profile_status_label = QLabel("-")
-        details_layout.addRow("Status:", self.profile_status_label)
         
         right_layout.addWidget(details_group)
         
         # Profile actions group
         actions_group = QGroupBox("Profile Actions")
         actions_layout = QGridLayout(actions_group)
-        
-        # Load profile button
-        self.load_profile_button = QPushButton("Load Profile")
-        self.load_profile_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
-        self.load_profile_button.setEnabled(False)
-        actions_layout.addWidget(self.load_profile_button, 0, 0)
-        
-        # Set as default button
-        self.set_default_button = QPushButton("Set as Default")
-        self.set_default_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f39c12;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #e67e22;
-            }
-        """)
-        self.set_default_button.setEnabled(False)
-        actions_layout.addWidget(self.set_default_button, 0, 1)
-        
-        # Export profile button
-        self.export_profile_button = QPushButton("Export Profile")
-        self.export_profile_button.setStyleSheet("""
-            QPushButton {
-                background-color: #9b59b6;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #8e44ad;
-            }
-        """)
-        self.export_profile_button.setEnabled(False)
-        actions_layout.addWidget(self.export_profile_button, 1, 0)
-        
-        # Import profile button
-        self.import_profile_button = QPushButton("Import Profile")
-        self.import_profile_button.setStyleSheet("""
-            QPushButton {
-                background-color: #16a085;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #138d75;
-            }
-        """)
-        actions_layout.addWidget(self.import_profile_button, 1, 1)
+        for i, button in enumerate(self._make_buttons(self._ACTION_BUTTONS)):
+            actions_layout.addWidget(button, i // 2, i % 2)
         
         right_layout.addWidget(actions_group)
         
@@ -283,9 +258,19 @@ class ProfileManagementDialog(QDialog):
         
         parent.addWidget(right_panel)
 
+    def _set_status(self, text: str):
+        """Show a transient success message in the status label"""
+        self._status_label.setText(text)
+        self._status_timer.start()
+
     def setup_connections(self):
         """Setup signal connections"""
-        self.profile_list.itemSelectionChanged.connect(self.on_profile_selection_changed)
+        # Bursts of selection changes (e.g. arrow-keying) collapse into one details update
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(0)
+        self._selection_timer.timeout.connect(self._apply_selection_change)
+        self.profile_list.itemSelectionChanged.connect(self._selection_timer.start)
         self.new_profile_button.clicked.connect(self.create_new_profile)
         self.delete_profile_button.clicked.connect(self.delete_selected_profile)
         self.load_profile_button.clicked.connect(self.load_selected_profile)
@@ -295,38 +280,63 @@ class ProfileManagementDialog(QDialog):
         self.backup_button.clicked.connect(self.create_backup)
         self.close_button.clicked.connect(self.accept)
 
-    def refresh_profile_list(self):
-        """Refresh the profile list display"""
-        self.profile_list.clear()
-
-        profiles = self.profile_manager.get_all_profiles()
-        current_profile_name = self.profile_manager.get_current_profile_name()
-
-        for profile in profiles:
-            item = QListWidgetItem()
-
-            # Create display text
-            display_text = profile.name
-            if profile.is_default:
-                display_text += " (Default)"
-            if profile.is_active:
-                display_text += " (Active)"
-
-            item.setText(display_text)
-            item.setData(Qt.UserRole, profile.name)
-
-            # Style active profile
-            if profile.is_active:
-                item.setBackground(Qt.lightGray)
-                font = item.font()
-                font.setBold(True)
-                item.setFont(font)
+    def _request_refresh(self):
+        """Refresh the profile list now if visible, otherwise on the next show"""
+        if not self.isVisible():
+            self._refresh_pending = True
+            return
+        self._refresh_pending = False
+        self.refresh_profile_list()
 
-            self.profile_list.addItem(item)
+    def showEvent(self, event):
+        """Run any refresh deferred while the dialog was hidden"""
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.refresh_profile_list()
+        super().showEvent(event)
 
-            # Select current profile
-            if profile.name == current_profile_name:
-                self.profile_list.setCurrentItem(item)
+    def refresh_profile_list(self):
+        """Refresh the profile list display, only touching rows that changed"""
+        current_profile_name, _, profiles = self.profile_manager.get_profiles_snapshot()
+        # Active/default flags may have changed, so the details panel must re-render
+        self._last_rendered_profile = None
+        self._profiles_by_name = {}
+
+        self.profile_list.setUpdatesEnabled(False)
+        self.profile_list.blockSignals(True)
+        try:
+            # Add/update rows straight from the manager, then drop rows not seen
+            for profile in profiles:
+                self._profiles_by_name[profile.name] = profile
+                item = self._item_by_name.get(profile.name)
+                if item is None:
+                    item = QListWidgetItem()
+                    self.profile_list.addItem(item)
+                    self._item_by_name[profile.name] = item
+                # Rows carry the ProfileInfo itself, so handlers need no lookup by name
+                if item.data(Qt.UserRole) is not profile:
+                    item.setData(Qt.UserRole, profile)
+
+                # Restyle only when the default/active flags changed
+                flags = int(profile.is_default) | (int(profile.is_active) << 1)
+                if item.data(Qt.UserRole + 1) != flags:
+                    self._style_profile_item(item, profile)
+                    item.setData(Qt.UserRole + 1, flags)
+
+                # Select current profile
+                if profile.name == current_profile_name:
+                    self.profile_list.setCurrentItem(item)
+
+            # Drop rows for profiles that no longer exist
+            for name in [n for n in self._item_by_name if n not in self._profiles_by_name]:
+                item = self._item_by_name.pop(name)
+                self.profile_list.takeItem(self.profile_list.row(item))
+        finally:
+            self.profile_list.blockSignals(False)
+            self.profile_list.setUpdatesEnabled(True)
+
+        # Selection signals were blocked above, so sync the details panel here
+        self._apply_selection_change()
 
         # Update current profile display
         if current_profile_name:
@@ -334,19 +344,26 @@ class ProfileManagementDialog(QDialog):
         else:
             self.current_profile_label.setText("No active profile")
 
-    def on_profile_selection_changed(self):
-        """Handle profile selection change"""
+    def _style_profile_item(self, item: QListWidgetItem, profile: ProfileInfo):
+        """Set a list item's text and styling from the profile's flags"""
+        # Create display text
+        display_text = profile.name
+        if profile.is_default:
+            display_text += " (Default)"
+        if profile.is_active:
+            display_text += " (Active)"
+        item.setText(display_text)
+
+        # Style active profile
+        item.setBackground(self._active_brush if profile.is_active else self._no_brush)
+        item.setFont(self._bold_font if profile.is_active else self._normal_font)
+
+    def _apply_selection_change(self):
+        """Handle profile selection change (coalesced by _selection_timer)"""
         current_item = self.profile_list.currentItem()
 
         if current_item:
-            profile_name = current_item.data(Qt.UserRole)
-            profile = None
-
-            # Find the profile info
-            for p in self.profile_manager.get_all_profiles():
-                if p.name == profile_name:
-                    profile = p
-                    break
+            profile: ProfileInfo = current_item.data(Qt.UserRole)
 
             if profile:
                 self.update_profile_details(profile)
@@ -360,21 +377,16 @@ class ProfileManagementDialog(QDialog):
 
     def update_profile_details(self, profile: ProfileInfo):
         """Update the profile details display"""
+        if (profile.name == self._last_rendered_profile
+                and profile.last_modified == self._last_rendered_mtime):
+            return
+
         self.profile_name_label.setText(profile.name)
         self.profile_description_label.setText(profile.description or "No description")
 
         # Format dates
-        try:
-            created_date = datetime.fromisoformat(profile.created_date)
-            self.profile_created_label.setText(created_date.strftime("%Y-%m-%d %H:%M"))
-        except:
-            self.profile_created_label.setText(profile.created_date)
-
-        try:
-            modified_date = datetime.fromisoformat(profile.last_modified)
-            self.profile_modified_label.setText(modified_date.strftime("%Y-%m-%d %H:%M"))
-        except:
-            self.profile_modified_label.setText(profile.last_modified)
+        self.profile_created_label.setText(_fmt_iso(profile.created_date))
+        self.profile_modified_label.setText(_fmt_iso(profile.last_modified))
 
         # Statistics
         self.profile_gestures_label.setText(str(profile.custom_gesture_count))
@@ -390,21 +402,30 @@ class ProfileManagementDialog(QDialog):
         if status_parts:
             status_text = ", ".join(status_parts)
             self.profile_status_label.setText(status_text)
-            self.profile_status_label.setStyleSheet("color: #27ae60; font-weight: bold;")
+            self._set_status_style("profile_status_active")
         else:
             self.profile_status_label.setText("Inactive")
-            self.profile_status_label.setStyleSheet("color: #7f8c8d;")
+            self._set_status_style("profile_status_inactive")
+
+        self._last_rendered_profile = profile.name
+        self._last_rendered_mtime = profile.last_modified
 
     def clear_profile_details(self):
         """Clear the profile details display"""
-        self.profile_name_label.setText("No profile selected")
-        self.profile_description_label.setText("-")
-        self.profile_created_label.setText("-")
-        self.profile_modified_label.setText("-")
-        self.profile_gestures_label.setText("-")
-        self.profile_mappings_label.setText("-")
-        self.profile_status_label.setText("-")
-        self.profile_status_label.setStyleSheet("")
+        self._last_rendered_profile = None
+        for attr, _, placeholder in self._DETAIL_ROWS:
+            getattr(self, attr).setText(placeholder)
+        self._set_status_style("")
+
+    def _set_status_style(self, object_name: str):
+        """Switch the status label's QSS rule, re-polishing only on change"""
+        if object_name == self._last_status_style:
+            return
+        self._last_status_style = object_name
+        label = self.profile_status_label
+        label.setObjectName(object_name)
+        label.style().unpolish(label)
+        label.style().polish(label)
 
     def enable_profile_actions(self, enabled: bool, profile: ProfileInfo = None):
         """Enable/disable profile action buttons"""
@@ -418,8 +439,6 @@ class ProfileManagementDialog(QDialog):
 
     def create_new_profile(self):
         """Create a new profile"""
-        from PySide6.QtWidgets import QInputDialog
-
         # Get profile name
         name, ok = QInputDialog.getText(
             self, "New Profile",
@@ -433,8 +452,7 @@ class ProfileManagementDialog(QDialog):
         name = name.strip()
 
         # Check if name already exists
-        existing_profiles = [p.name for p in self.profile_manager.get_all_profiles()]
-        if name in existing_profiles:
+        if name in self._profiles_by_name:
             QMessageBox.warning(
                 self, "Profile Exists",
                 f"A profile named '{name}' already exists."
@@ -453,11 +471,8 @@ class ProfileManagementDialog(QDialog):
 
         # Create profile
         if self.profile_manager.create_profile(name, description.strip()):
-            QMessageBox.information(
-                self, "Profile Created",
-                f"Profile '{name}' created successfully."
-            )
-            self.refresh_profile_list()
+            self._set_status(f"Profile '{name}' created successfully.")
+            self._request_refresh()
         else:
             QMessageBox.critical(
                 self, "Error",
@@ -470,7 +485,8 @@ class ProfileManagementDialog(QDialog):
         if not current_item:
             return
 
-        profile_name = current_item.data(Qt.UserRole)
+        profile: ProfileInfo = current_item.data(Qt.UserRole)
+        profile_name = profile.name
 
         # Confirm deletion
         reply = QMessageBox.question(
@@ -483,11 +499,8 @@ class ProfileManagementDialog(QDialog):
 
         if reply == QMessageBox.Yes:
             if self.profile_manager.delete_profile(profile_name):
-                QMessageBox.information(
-                    self, "Profile Deleted",
-                    f"Profile '{profile_name}' deleted successfully."
-                )
-                self.refresh_profile_list()
+                self._set_status(f"Profile '{profile_name}' deleted successfully.")
+                self._request_refresh()
             else:
                 QMessageBox.critical(
                     self, "Error",
@@ -500,14 +513,12 @@ class ProfileManagementDialog(QDialog):
         if not current_item:
             return
 
-        profile_name = current_item.data(Qt.UserRole)
+        profile: ProfileInfo = current_item.data(Qt.UserRole)
+        profile_name = profile.name
 
         if self.profile_manager.load_profile(profile_name):
-            QMessageBox.information(
-                self, "Profile Loaded",
-                f"Profile '{profile_name}' loaded successfully."
-            )
-            self.refresh_profile_list()
+            self._set_status(f"Profile '{profile_name}' loaded successfully.")
+            self._request_refresh()
             self.profile_changed.emit(profile_name)
         else:
             QMessageBox.critical(
@@ -521,14 +532,12 @@ class ProfileManagementDialog(QDialog):
         if not current_item:
             return
 
-        profile_name = current_item.data(Qt.UserRole)
+        profile: ProfileInfo = current_item.data(Qt.UserRole)
+        profile_name = profile.name
 
         if self.profile_manager.set_default_profile(profile_name):
-            QMessageBox.information(
-                self, "Default Profile Set",
-                f"Profile '{profile_name}' is now the default profile."
-            )
-            self.refresh_profile_list()
+            self._set_status(f"Profile '{profile_name}' is now the default profile.")
+            self._request_refresh()
         else:
             QMessageBox.critical(
                 self, "Error",
@@ -541,7 +550,8 @@ class ProfileManagementDialog(QDialog):
         if not current_item:
             return
 
-        profile_name = current_item.data(Qt.UserRole)
+        profile: ProfileInfo = current_item.data(Qt.UserRole)
+        profile_name = profile.name
 
         # Get export file path
         filename, _ = QFileDialog.getSaveFileName(
@@ -551,16 +561,29 @@ class ProfileManagementDialog(QDialog):
         )
 
         if filename:
-            if self.profile_manager.export_profile(profile_name, filename):
-                QMessageBox.information(
-                    self, "Profile Exported",
-                    f"Profile '{profile_name}' exported to {filename}"
-                )
-            else:
+            # Metadata and paths are snapshotted here; the worker only does file I/O
+            job = self.profile_manager.export_job(profile_name, filename)
+            if job is None:
                 QMessageBox.critical(
                     self, "Export Error",
                     f"Failed to export profile '{profile_name}'."
                 )
+                return
+            self.export_profile_button.setEnabled(False)
+            start_background_task(
+                self, partial(self._on_profile_exported, profile_name, filename), job)
+
+    def _on_profile_exported(self, profile_name: str, filename: str, ok: bool, result):
+        """Report the result of a background profile export"""
+        # Re-derive button states from the (possibly changed) selection
+        self._apply_selection_change()
+        if ok and result:
+            self._set_status(f"Profile '{profile_name}' exported to {filename}")
+        else:
+            QMessageBox.critical(
+                self, "Export Error",
+                f"Failed to export profile '{profile_name}'."
+            )
 
     def import_profile(self):
         """Import a profile from file"""
@@ -572,11 +595,8 @@ class ProfileManagementDialog(QDialog):
 
         if filename:
             if self.profile_manager.import_profile(filename):
-                QMessageBox.information(
-                    self, "Profile Imported",
-                    f"Profile imported successfully from {filename}"
-                )
-                self.refresh_profile_list()
+                self._set_status(f"Profile imported successfully from {filename}")
+                self._request_refresh()
             else:
                 QMessageBox.critical(
                     self, "Import Error",
@@ -585,13 +605,15 @@ class ProfileManagementDialog(QDialog):
 
     def create_backup(self):
         """Create a backup of all profiles"""
-        backup_file = self.profile_manager.create_backup()
-
-        if backup_file:
-            QMessageBox.information(
-                self, "Backup Created",
-                f"Backup created successfully:\n{backup_file}"
-            )
+        self.backup_button.setEnabled(False)
+        # Profile list is snapshotted here; the worker only does file I/O
+        start_background_task(self, self._on_backup_created, self.profile_manager.backup_job())
+
+    def _on_backup_created(self, ok: bool, backup_file):
+        """Report the result of a background backup"""
+        self.backup_button.setEnabled(True)
+        if ok and backup_file:
+            self._set_status(f"Backup created successfully: {backup_file}")
         else:
             QMessageBox.critical(
                 self, "Backup Error",
@@ -1,13 +1,47 @@
 import os
 import json
 import shutil
+import hashlib
+import logging
+import gzip
+from collections import deque
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple, NamedTuple, Iterator, Callable
+from dataclasses import dataclass, fields
+from functools import lru_cache, partial
+from operator import attrgetter
 from config import PROJECT_ROOT, ACTION_MAPPING_CONFIG
 
+logger = logging.getLogger('ProfileManager')
 
-@dataclass
+# Initial contents of a new profile's data files
+_EMPTY_OBJ = b'{}\n'
+
+# Optional faster JSON backend; the stdlib json module is used otherwise
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON from bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any, indent: bool = True) -> bytes:
+    """Serialize an object to JSON bytes, two-space indented by default"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+
+@dataclass(slots=True)
 class ProfileInfo:
     """Profile information data class"""
     name: str
@@ -20,6 +54,193 @@ class ProfileInfo:
     is_active: bool
 
 
+# Serializers generated once from the field list instead of per-call dict literals
+_PROFILE_FIELDS = tuple(f.name for f in fields(ProfileInfo))
+_profile_values = attrgetter(*_PROFILE_FIELDS)
+# Exported profiles omit last_modified and the default/active flags
+_EXPORT_FIELDS = ('name', 'description', 'created_date', 'custom_gesture_count', 'action_mapping_count')
+_export_values = attrgetter(*_EXPORT_FIELDS)
+
+
+def _profile_to_dict(info: ProfileInfo) -> Dict[str, Any]:
+    """Convert a ProfileInfo to its stored dict form"""
+    return dict(zip(_PROFILE_FIELDS, _profile_values(info)))
+
+
+def _read_bytes(path: str) -> bytes:
+    """Read a whole file, returning b'' if it does not exist"""
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return b''
+
+
+def _read_json_bytes(path: str) -> bytes:
+    """Read a JSON file as stripped raw bytes (b'' if missing or empty), raising ValueError if it doesn't parse"""
+    data = _read_bytes(path).strip()
+    if data:
+        try:
+            _loads(data)
+        except ValueError as e:
+            raise ValueError(f"Invalid JSON in {path}: {e}") from e
+    return data
+
+
+def _bounded_map(executor: ThreadPoolExecutor, fn, items, window: int) -> Iterator[Any]:
+    """Like executor.map, but with at most `window` results in flight at once"""
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+# Expected types in an exported profile file; every key is optional
+_IMPORT_SCHEMA = {
+    'profile_metadata': dict,
+    'custom_gestures': dict,
+    'action_mappings': dict,
+}
+_IMPORT_METADATA_SCHEMA = {
+    'name': str,
+    'description': str,
+}
+
+
+def _validate_import(data: Any):
+    """Raise ValueError unless data has the shape of an exported profile"""
+    if not isinstance(data, dict):
+        raise ValueError("import file is not a JSON object")
+    for key, expected in _IMPORT_SCHEMA.items():
+        if key in data and not isinstance(data[key], expected):
+            raise ValueError(f"'{key}' must be a {expected.__name__}")
+    metadata = data.get('profile_metadata', {})
+    for key, expected in _IMPORT_METADATA_SCHEMA.items():
+        if key in metadata and not isinstance(metadata[key], expected):
+            raise ValueError(f"'profile_metadata.{key}' must be a {expected.__name__}")
+
+
+class ProfilePaths(NamedTuple):
+    """Filesystem locations of one profile's data"""
+    dir: str
+    gestures_file: str
+    mappings_file: str
+
+
+@lru_cache(maxsize=256)
+def _profile_paths(profiles_directory: str, name: str) -> ProfilePaths:
+    """Build (once per profile) the directory and data file paths"""
+    profile_dir = os.path.join(profiles_directory, name)
+    return ProfilePaths(
+        profile_dir,
+        os.path.join(profile_dir, 'custom_gestures', 'gestures_metadata.json'),
+        os.path.join(profile_dir, 'action_mappings', 'mappings.json'),
+    )
+
+
+def _write_profile_export(export_path: str, metadata: Dict[str, Any], paths: ProfilePaths) -> bool:
+    """Write an export file from a metadata snapshot and the profile's data files"""
+    try:
+        # The data files are spliced in as raw bytes once they are known to
+        # parse, so a corrupt file fails the export instead of corrupting it
+        custom_gestures = _read_json_bytes(paths.gestures_file) or b'{}'
+        action_mappings = _read_json_bytes(paths.mappings_file) or b'{}'
+
+        # Save export file
+        with open(export_path, 'wb') as f:
+            f.write(
+                b'{"profile_metadata": ' + _dumps(metadata)
+                + b', "custom_gestures": ' + custom_gestures
+                + b', "action_mappings": ' + action_mappings
+                + b', "export_date": ' + _dumps(datetime.now().isoformat(), indent=False)
+                + b', "version": "1.0"}'
+            )
+
+        return True
+
+    except (OSError, TypeError, ValueError):
+        logger.exception("Error exporting profile '%s'", metadata.get('name'))
+        return False
+
+
+def _write_backup(backup_directory: str, compress: bool, profiles_metadata: Dict[str, Dict[str, Any]],
+                  profile_files: List[Tuple[str, Tuple[Tuple[str, str], ...]]]) -> Optional[str]:
+    """Write a backup of all profiles from a metadata snapshot and their data files"""
+    tmp_file = None
+    try:
+        now = datetime.now()
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
+        backup_file = os.path.join(
+            backup_directory,
+            f"profiles_backup_{timestamp}.json"
+        )
+        if compress:
+            backup_file += '.gz'
+        # Written aside and moved into place only once complete
+        tmp_file = backup_file + '.tmp'
+
+        all_paths = [path for _, files in profile_files for _, path in files]
+
+        # Stream the backup: profile data files are checked to parse and then
+        # copied in verbatim rather than re-serialized into one in-memory dict.
+        # The reads are I/O bound, so they are issued concurrently and
+        # consumed in order, with only a few files held in memory at once;
+        # the large buffer coalesces the framing writes.
+        workers = min(32, max(1, len(all_paths)))
+        with ThreadPoolExecutor(max_workers=workers) as executor, \
+                open(tmp_file, 'wb', buffering=1 << 20) as raw, \
+                (gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=1)
+                 if compress else nullcontext(raw)) as f:
+            contents = _bounded_map(executor, _read_json_bytes, all_paths, 2 * workers)
+
+            f.write(b'{"profiles_metadata": ')
+            f.write(_dumps(profiles_metadata))
+            f.write(b', "profiles_data": {')
+
+            for i, (profile_name, files) in enumerate(profile_files):
+                if i:
+                    f.write(b', ')
+                f.write(_dumps(profile_name, indent=False) + b': {')
+
+                separator = b''
+                for (key, _), data in zip(files, contents):
+                    # Skip missing or empty files, which would make the backup invalid JSON
+                    if not data:
+                        continue
+                    f.write(separator + b'"' + key.encode('ascii') + b'": ')
+                    f.write(data)
+                    separator = b', '
+
+                f.write(b'}')
+
+            f.write(b'}, "backup_date": ')
+            f.write(_dumps(now.isoformat(), indent=False))
+            f.write(b', "version": "1.0"}')
+
+        os.replace(tmp_file, backup_file)
+        return backup_file
+
+    except (OSError, TypeError, ValueError):
+        logger.exception("Error creating backup")
+        # Don't leave a truncated backup behind
+        if tmp_file is not None:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+        return None
+
+
+class ProfilesSnapshot(NamedTuple):
+    """Current/default profile names plus a stream over all profiles"""
+    current: Optional[str]
+    default: Optional[str]
+    profiles: Iterator[ProfileInfo]
+
+
 class ProfileManager:
     """
     GFLOW-18: Unified Profile Management System
@@ -34,13 +255,24 @@ class ProfileManager:
             'profiles_metadata_file': 'profiles_metadata.json',
             'default_profile_name': 'default',
             'backup_directory': os.path.join(PROJECT_ROOT, 'data', 'backups'),
+            'compress_backups': False,  # opt-in: gzip (level 1) backups as .json.gz
         }
         
+        # Joined once; the metadata file is read and written on every profile change
+        self._metadata_file = os.path.join(
+            self.config['profiles_directory'],
+            self.config['profiles_metadata_file']
+        )
+        
         # Current state
         self.current_profile = None
         self.profiles_metadata: Dict[str, ProfileInfo] = {}
+        # Name of the profile flagged is_default, kept in sync by every mutation
+        self._default_profile_name: Optional[str] = None
         self.action_mapping_manager = None  # Will be injected
         self.custom_gesture_manager = None  # Will be injected
+        # Digest of the last metadata bytes written, to skip identical rewrites
+        self._last_metadata_hash: Optional[bytes] = None
         
         # Create directories
         self._create_directories()
@@ -63,60 +295,59 @@ class ProfileManager:
     
     def _load_profiles_metadata(self):
         """Load profiles metadata from storage"""
-        metadata_file = os.path.join(
-            self.config['profiles_directory'], 
-            self.config['profiles_metadata_file']
-        )
-        
-        if os.path.exists(metadata_file):
-            try:
-                with open(metadata_file, 'r') as f:
-                    data = json.load(f)
+        metadata_file = self._metadata_file
+
+        try:
+            with open(metadata_file, 'rb') as f:
+                data = _loads(f.read())
+            
+            # Convert to ProfileInfo objects
+            for name, profile_data in data.items():
+                self.profiles_metadata[name] = ProfileInfo(
+                    name=profile_data['name'],
+                    description=profile_data['description'],
+                    created_date=profile_data['created_date'],
+                    last_modified=profile_data['last_modified'],
+                    custom_gesture_count=profile_data.get('custom_gesture_count', 0),
+                    action_mapping_count=profile_data.get('action_mapping_count', 0),
+                    is_default=profile_data.get('is_default', False),
+                    is_active=profile_data.get('is_active', False)
+                )
+                if self.profiles_metadata[name].is_default:
+                    self._default_profile_name = name
                 
-                # Convert to ProfileInfo objects
-                for name, profile_data in data.items():
-                    self.profiles_metadata[name] = ProfileInfo(
-                        name=profile_data['name'],
-                        description=profile_data['description'],
-                        created_date=profile_data['created_date'],
-                        last_modified=profile_data['last_modified'],
-                        custom_gesture_count=profile_data.get('custom_gesture_count', 0),
-                        action_mapping_count=profile_data.get('action_mapping_count', 0),
-                        is_default=profile_data.get('is_default', False),
-                        is_active=profile_data.get('is_active', False)
-                    )
-                    
-            except Exception as e:
-                print(f"Error loading profiles metadata: {e}")
-                self.profiles_metadata = {}
-    
+        except FileNotFoundError:
+            # First run: no metadata yet
+            return
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            logger.exception("Error loading profiles metadata")
+            self.profiles_metadata = {}
+            self._default_profile_name = None
+
     def _save_profiles_metadata(self):
         """Save profiles metadata to storage"""
-        metadata_file = os.path.join(
-            self.config['profiles_directory'], 
-            self.config['profiles_metadata_file']
-        )
-        
+        metadata_file = self._metadata_file
+
         try:
             # Convert ProfileInfo objects to dict
-            data = {}
-            for name, profile_info in self.profiles_metadata.items():
-                data[name] = {
-                    'name': profile_info.name,
-                    'description': profile_info.description,
-                    'created_date': profile_info.created_date,
-                    'last_modified': profile_info.last_modified,
-                    'custom_gesture_count': profile_info.custom_gesture_count,
-                    'action_mapping_count': profile_info.action_mapping_count,
-                    'is_default': profile_info.is_default,
-                    'is_active': profile_info.is_active
-                }
-            
-            with open(metadata_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            data = {name: _profile_to_dict(profile_info)
+                    for name, profile_info in self.profiles_metadata.items()}
+
+            serialized = _dumps(data)
+            digest = hashlib.blake2b(serialized, digest_size=8).digest()
+            if digest == self._last_metadata_hash:
+                return
+
+            # Write a sibling temp file and rename over the original, so a crash
+            # mid-write never leaves a truncated metadata file behind
+            tmp_file = metadata_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(serialized)
+            os.replace(tmp_file, metadata_file)
+            self._last_metadata_hash = digest
                 
-        except Exception as e:
-            print(f"Error saving profiles metadata: {e}")
+        except (OSError, TypeError, ValueError):
+            logger.exception("Error saving profiles metadata")
     
     def _ensure_default_profile(self):
         """Ensure default profile exists"""
@@ -153,21 +384,20 @@ class ProfileManager:
             return False
         
         # Create profile directory structure
-        profile_dir = os.path.join(self.config['profiles_directory'], name)
-        custom_gestures_dir = os.path.join(profile_dir, 'custom_gestures')
-        action_mappings_dir = os.path.join(profile_dir, 'action_mappings')
+        paths = self._profile_paths(name)
         
         try:
-            os.makedirs(profile_dir, exist_ok=True)
-            os.makedirs(custom_gestures_dir, exist_ok=True)
-            os.makedirs(action_mappings_dir, exist_ok=True)
+            # Creating the leaf directories also creates the profile directory
+            os.makedirs(os.path.dirname(paths.gestures_file), exist_ok=True)
+            os.makedirs(os.path.dirname(paths.mappings_file), exist_ok=True)
             
             # Create profile metadata
+            now = datetime.now().isoformat()
             profile_info = ProfileInfo(
                 name=name,
                 description=description,
-                created_date=datetime.now().isoformat(),
-                last_modified=datetime.now().isoformat(),
+                created_date=now,
+                last_modified=now,
                 custom_gesture_count=0,
                 action_mapping_count=0,
                 is_default=set_as_default,
@@ -178,6 +408,7 @@ class ProfileManager:
             if set_as_default:
                 for profile in self.profiles_metadata.values():
                     profile.is_default = False
+                self._default_profile_name = name
             
             self.profiles_metadata[name] = profile_info
             
@@ -197,24 +428,34 @@ class ProfileManager:
             
             return True
             
-        except Exception as e:
-            print(f"Error creating profile '{name}': {e}")
+        except Exception:
+            logger.exception("Error creating profile '%s'", name)
             return False
     
     def _initialize_profile_data(self, profile_name: str):
         """Initialize empty data files for a new profile"""
-        profile_dir = os.path.join(self.config['profiles_directory'], profile_name)
+        paths = self._profile_paths(profile_name)
         
         # Initialize custom gestures metadata
-        custom_gestures_file = os.path.join(profile_dir, 'custom_gestures', 'gestures_metadata.json')
-        with open(custom_gestures_file, 'w') as f:
-            json.dump({}, f)
+        with open(paths.gestures_file, 'wb') as f:
+            f.write(_EMPTY_OBJ)
         
         # Initialize action mappings
-        action_mappings_file = os.path.join(profile_dir, 'action_mappings', 'mappings.json')
-        with open(action_mappings_file, 'w') as f:
-            json.dump({}, f)
+        with open(paths.mappings_file, 'wb') as f:
+            f.write(_EMPTY_OBJ)
     
+    def _profile_paths(self, profile_name: str) -> ProfilePaths:
+        """Get the cached directory and data file paths for a profile"""
+        return _profile_paths(self.config['profiles_directory'], profile_name)
+
+    def _profile_data_files(self, profile_name: str) -> Tuple[Tuple[str, str], ...]:
+        """Get (backup key, file path) pairs for a profile's data files"""
+        paths = self._profile_paths(profile_name)
+        return (
+            ('custom_gestures', paths.gestures_file),
+            ('action_mappings', paths.mappings_file),
+        )
+
     def delete_profile(self, name: str) -> bool:
         """
         Delete a profile
@@ -232,12 +473,16 @@ class ProfileManager:
         
         try:
             # Remove profile directory
-            profile_dir = os.path.join(self.config['profiles_directory'], name)
-            if os.path.exists(profile_dir):
-                shutil.rmtree(profile_dir)
+            try:
+                shutil.rmtree(self._profile_paths(name).dir)
+            except FileNotFoundError:
+                pass
+            _profile_paths.cache_clear()
             
             # Remove from metadata
             del self.profiles_metadata[name]
+            if name == self._default_profile_name:
+                self._default_profile_name = None
 
             # GFLOW-18: Delete from ActionMappingManager as well
             if self.action_mapping_manager and name in self.action_mapping_manager.profiles:
@@ -248,8 +493,8 @@ class ProfileManager:
             
             return True
             
-        except Exception as e:
-            print(f"Error deleting profile '{name}': {e}")
+        except Exception:
+            logger.exception("Error deleting profile '%s'", name)
             return False
 
     def load_profile(self, name: str) -> bool:
@@ -289,7 +534,7 @@ class ProfileManager:
                 # Now load the profile
                 success = self.action_mapping_manager.load_profile(name)
                 if not success:
-                    print(f"Warning: Failed to load action mappings for profile {name}")
+                    logger.warning("Failed to load action mappings for profile %s", name)
 
             if self.custom_gesture_manager:
                 self.custom_gesture_manager.set_profile(name)
@@ -302,8 +547,8 @@ class ProfileManager:
 
             return True
 
-        except Exception as e:
-            print(f"Error loading profile '{name}': {e}")
+        except Exception:
+            logger.exception("Error loading profile '%s'", name)
             return False
 
     def _save_current_profile(self):
@@ -321,8 +566,8 @@ class ProfileManager:
             # Update counts
             self._update_profile_counts(self.current_profile)
 
-        except Exception as e:
-            print(f"Error saving current profile: {e}")
+        except Exception:
+            logger.exception("Error saving current profile")
 
     def _update_profile_counts(self, profile_name: str):
         """Update gesture and mapping counts for a profile"""
@@ -333,24 +578,33 @@ class ProfileManager:
             # Count custom gestures
             custom_gesture_count = 0
             if self.custom_gesture_manager:
-                custom_gesture_count = len(self.custom_gesture_manager.get_gesture_list())
+                custom_gesture_count = self.custom_gesture_manager.get_gesture_count()
 
             # Count action mappings
             action_mapping_count = 0
             if self.action_mapping_manager:
-                action_mapping_count = len(self.action_mapping_manager.get_all_mappings(enabled_only=False))
+                action_mapping_count = self.action_mapping_manager.get_mapping_count(enabled_only=False)
 
             # Update metadata
             self.profiles_metadata[profile_name].custom_gesture_count = custom_gesture_count
             self.profiles_metadata[profile_name].action_mapping_count = action_mapping_count
 
-        except Exception as e:
-            print(f"Error updating profile counts: {e}")
+        except Exception:
+            logger.exception("Error updating profile counts")
 
     def get_all_profiles(self) -> List[ProfileInfo]:
         """Get list of all profiles"""
         return list(self.profiles_metadata.values())
 
+    def iter_profiles(self) -> Iterator[ProfileInfo]:
+        """Iterate over all profiles without building a list"""
+        yield from self.profiles_metadata.values()
+
+    def get_profiles_snapshot(self) -> ProfilesSnapshot:
+        """Get the current and default profile names together with iter_profiles()"""
+        return ProfilesSnapshot(self.current_profile, self.get_default_profile_name(),
+                                self.iter_profiles())
+
     def get_current_profile(self) -> Optional[ProfileInfo]:
         """Get current active profile"""
         if self.current_profile and self.current_profile in self.profiles_metadata:
@@ -380,6 +634,7 @@ class ProfileManager:
 
         # Set new default
         self.profiles_metadata[name].is_default = True
+        self._default_profile_name = name
         self.profiles_metadata[name].last_modified = datetime.now().isoformat()
 
         # Save metadata
@@ -389,10 +644,7 @@ class ProfileManager:
 
     def get_default_profile_name(self) -> Optional[str]:
         """Get the default profile name"""
-        for name, profile in self.profiles_metadata.items():
-            if profile.is_default:
-                return name
-        return self.config['default_profile_name']
+        return self._default_profile_name or self.config['default_profile_name']
 
     def export_profile(self, profile_name: str, export_path: str) -> bool:
         """
@@ -405,48 +657,20 @@ class ProfileManager:
         Returns:
             True if exported successfully
         """
-        if profile_name not in self.profiles_metadata:
-            return False
-
-        try:
-            profile_dir = os.path.join(self.config['profiles_directory'], profile_name)
-
-            # Collect all profile data
-            export_data = {
-                'profile_metadata': {
-                    'name': self.profiles_metadata[profile_name].name,
-                    'description': self.profiles_metadata[profile_name].description,
-                    'created_date': self.profiles_metadata[profile_name].created_date,
-                    'custom_gesture_count': self.profiles_metadata[profile_name].custom_gesture_count,
-                    'action_mapping_count': self.profiles_metadata[profile_name].action_mapping_count,
-                },
-                'custom_gestures': {},
-                'action_mappings': {},
-                'export_date': datetime.now().isoformat(),
-                'version': '1.0'
-            }
-
-            # Load custom gestures data
-            custom_gestures_file = os.path.join(profile_dir, 'custom_gestures', 'gestures_metadata.json')
-            if os.path.exists(custom_gestures_file):
-                with open(custom_gestures_file, 'r') as f:
-                    export_data['custom_gestures'] = json.load(f)
-
-            # Load action mappings data
-            action_mappings_file = os.path.join(profile_dir, 'action_mappings', 'mappings.json')
-            if os.path.exists(action_mappings_file):
-                with open(action_mappings_file, 'r') as f:
-                    export_data['action_mappings'] = json.load(f)
-
-            # Save export file
-            with open(export_path, 'w') as f:
-                json.dump(export_data, f, indent=2)
+        job = self.export_job(profile_name, export_path)
+        return job() if job is not None else False
 
-            return True
+    def export_job(self, profile_name: str, export_path: str) -> Optional[Callable[[], bool]]:
+        """
+        Snapshot what exporting a profile needs and return the call that writes it
 
-        except Exception as e:
-            print(f"Error exporting profile '{profile_name}': {e}")
-            return False
+        The returned callable reads no manager state, so it can run off the
+        GUI thread. Returns None if the profile does not exist.
+        """
+        if profile_name not in self.profiles_metadata:
+            return None
+        metadata = dict(zip(_EXPORT_FIELDS, _export_values(self.profiles_metadata[profile_name])))
+        return partial(_write_profile_export, export_path, metadata, self._profile_paths(profile_name))
 
     def import_profile(self, import_path: str, new_name: Optional[str] = None) -> bool:
         """
@@ -460,8 +684,10 @@ class ProfileManager:
             True if imported successfully
         """
         try:
-            with open(import_path, 'r') as f:
-                import_data = json.load(f)
+            with open(import_path, 'rb') as f:
+                import_data = _loads(f.read())
+            # Reject malformed files before creating anything on disk
+            _validate_import(import_data)
 
             # Extract profile metadata
             profile_metadata = import_data.get('profile_metadata', {})
@@ -482,21 +708,19 @@ class ProfileManager:
             ):
                 return False
 
+            paths = self._profile_paths(profile_name)
+
             # Import custom gestures
             custom_gestures_data = import_data.get('custom_gestures', {})
             if custom_gestures_data:
-                profile_dir = os.path.join(self.config['profiles_directory'], profile_name)
-                custom_gestures_file = os.path.join(profile_dir, 'custom_gestures', 'gestures_metadata.json')
-                with open(custom_gestures_file, 'w') as f:
-                    json.dump(custom_gestures_data, f, indent=2)
+                with open(paths.gestures_file, 'wb') as f:
+                    f.write(_dumps(custom_gestures_data))
 
             # Import action mappings
             action_mappings_data = import_data.get('action_mappings', {})
             if action_mappings_data:
-                profile_dir = os.path.join(self.config['profiles_directory'], profile_name)
-                action_mappings_file = os.path.join(profile_dir, 'action_mappings', 'mappings.json')
-                with open(action_mappings_file, 'w') as f:
-                    json.dump(action_mappings_data, f, indent=2)
+                with open(paths.mappings_file, 'wb') as f:
+                    f.write(_dumps(action_mappings_data))
 
             # Update counts
             self._update_profile_counts(profile_name)
@@ -504,8 +728,8 @@ class ProfileManager:
 
             return True
 
-        except Exception as e:
-            print(f"Error importing profile: {e}")
+        except (OSError, ValueError, TypeError):
+            logger.exception("Error importing profile from %s", import_path)
             return False
 
     def create_backup(self) -> Optional[str]:
@@ -515,59 +739,17 @@ class ProfileManager:
         Returns:
             Path to backup file if successful, None otherwise
         """
-        try:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            backup_file = os.path.join(
-                self.config['backup_directory'],
-                f"profiles_backup_{timestamp}.json"
-            )
+        return self.backup_job()()
 
-            # Create backup data
-            backup_data = {
-                'profiles_metadata': {},
-                'profiles_data': {},
-                'backup_date': datetime.now().isoformat(),
-                'version': '1.0'
-            }
-
-            # Include metadata
-            for name, profile_info in self.profiles_metadata.items():
-                backup_data['profiles_metadata'][name] = {
-                    'name': profile_info.name,
-                    'description': profile_info.description,
-                    'created_date': profile_info.created_date,
-                    'last_modified': profile_info.last_modified,
-                    'custom_gesture_count': profile_info.custom_gesture_count,
-                    'action_mapping_count': profile_info.action_mapping_count,
-                    'is_default': profile_info.is_default,
-                    'is_active': profile_info.is_active
-                }
-
-            # Include all profile data
-            for profile_name in self.profiles_metadata.keys():
-                profile_dir = os.path.join(self.config['profiles_directory'], profile_name)
-                profile_data = {}
-
-                # Include custom gestures
-                custom_gestures_file = os.path.join(profile_dir, 'custom_gestures', 'gestures_metadata.json')
-                if os.path.exists(custom_gestures_file):
-                    with open(custom_gestures_file, 'r') as f:
-                        profile_data['custom_gestures'] = json.load(f)
-
-                # Include action mappings
-                action_mappings_file = os.path.join(profile_dir, 'action_mappings', 'mappings.json')
-                if os.path.exists(action_mappings_file):
-                    with open(action_mappings_file, 'r') as f:
-                        profile_data['action_mappings'] = json.load(f)
-
-                backup_data['profiles_data'][profile_name] = profile_data
-
-            # Save backup
-            with open(backup_file, 'w') as f:
-                json.dump(backup_data, f, indent=2)
-
-            return backup_file
-
-        except Exception as e:
-            print(f"Error creating backup: {e}")
-            return None
+    def backup_job(self) -> Callable[[], Optional[str]]:
+        """
+        Snapshot the profile list and return the call that writes the backup
+
+        The returned callable reads no manager state, so it can run off the
+        GUI thread.
+        """
+        profiles_metadata = {name: _profile_to_dict(profile_info)
+                             for name, profile_info in self.profiles_metadata.items()}
+        profile_files = [(name, self._profile_data_files(name)) for name in profiles_metadata]
+        return partial(_write_backup, self.config['backup_directory'],
+                       self.config['compress_backups'], profiles_metadata, profile_files)
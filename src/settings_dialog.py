@@ -1,6 +1,8 @@
 import json
 import os
-from typing import Dict, Any, Optional
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Set, Tuple
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QTabWidget,
     QWidget, QLabel, QPushButton, QSpinBox, QDoubleSpinBox,
@@ -8,8 +10,8 @@ from PySide6.QtWidgets import (
     QMessageBox, QFileDialog, QTextEdit, QFrame, QButtonGroup,
     QRadioButton, QScrollArea
 )
-from PySide6.QtCore import Qt, Signal, QSettings
-from PySide6.QtGui import QFont, QIntValidator, QDoubleValidator
+from PySide6.QtCore import Qt, Signal, Slot, QSettings, QSignalBlocker
+from PySide6.QtGui import QFont, QIntValidator, QDoubleValidator, QStandardItem
 from config import (
     WEBCAM_CONFIG, MEDIAPIPE_CONFIG, GESTURE_CONFIG, PERFORMANCE_CONFIG,
     UI_CONFIG, CUSTOM_GESTURE_CONFIG, PROJECT_ROOT, VISUAL_FEEDBACK_CONFIG, MOUSE_CONTROL_CONFIG,
@@ -34,6 +36,215 @@ except ImportError:
     }
 
 
+# (section, config defaults, ((widget attr, setter, key), ...)) for every
+# widget-backed setting; config dicts are read live since main updates them
+_SETTINGS_SCHEMA = (
+    ('webcam', WEBCAM_CONFIG, (
+        ('width_spin', 'setValue', 'width'),
+        ('height_spin', 'setValue', 'height'),
+        ('fps_spin', 'setValue', 'fps'),
+        ('device_spin', 'setValue', 'device_id'),
+        ('flip_check', 'setChecked', 'flip_horizontal'),
+    )),
+    ('mediapipe', MEDIAPIPE_CONFIG, (
+        ('max_hands_spin', 'setValue', 'max_num_hands'),
+        ('detection_conf_spin', 'setValue', 'min_detection_confidence'),
+        ('tracking_conf_spin', 'setValue', 'min_tracking_confidence'),
+        ('model_complexity_combo', 'setCurrentIndex', 'model_complexity'),
+    )),
+    ('gesture', GESTURE_CONFIG, (
+        ('recognition_threshold_spin', 'setValue', 'recognition_threshold'),
+        ('hold_time_spin', 'setValue', 'gesture_hold_time'),
+        ('smoothing_spin', 'setValue', 'smoothing_frames'),
+        ('debug_check', 'setChecked', 'debug_mode'),
+    )),
+    ('performance', PERFORMANCE_CONFIG, (
+        ('fps_interval_spin', 'setValue', 'fps_update_interval'),
+        ('history_spin', 'setValue', 'max_recognition_history'),
+        ('target_fps_spin', 'setValue', 'target_fps'),
+        ('max_latency_spin', 'setValue', 'max_latency_ms'),
+    )),
+    ('ui', UI_CONFIG, (
+        ('window_title_edit', 'setText', 'window_title'),
+        ('window_width_spin', 'setValue', 'window_width'),
+        ('window_height_spin', 'setValue', 'window_height'),
+        ('video_width_spin', 'setValue', 'video_width'),
+        ('video_height_spin', 'setValue', 'video_height'),
+    )),
+    # Custom gesture settings have no controls in the dialog
+    ('custom_gesture', CUSTOM_GESTURE_CONFIG, ()),
+    ('action_execution', ACTION_EXECUTION_CONFIG, (
+        ('input_library_combo', 'setCurrentText', 'input_library'),
+        ('failsafe_check', 'setChecked', 'enable_failsafe'),
+        ('action_delay_spin', 'setValue', 'default_action_delay'),
+        ('mouse_duration_spin', 'setValue', 'mouse_movement_duration'),
+        ('timeout_spin', 'setValue', 'action_timeout'),
+        ('log_actions_check', 'setChecked', 'log_all_actions'),
+        ('async_check', 'setChecked', 'async_execution'),
+    )),
+    # GFLOW-19: Visual feedback settings
+    ('visual_feedback', VISUAL_FEEDBACK_CONFIG, (
+        ('show_landmarks_check', 'setChecked', 'show_hand_landmarks'),
+        ('landmark_thickness_spin', 'setValue', 'landmark_thickness'),
+        ('connection_thickness_spin', 'setValue', 'connection_thickness'),
+        ('show_notifications_check', 'setChecked', 'show_gesture_notifications'),
+        ('notification_duration_spin', 'setValue', 'notification_duration'),
+        ('notification_position_combo', 'setCurrentText', 'notification_position'),
+        ('notification_font_size_spin', 'setValue', 'notification_font_size'),
+        ('enable_animations_check', 'setChecked', 'enable_notification_animations'),
+    )),
+    # GFLOW-E04: Mouse control settings (gesture_name is handled separately)
+    ('mouse_control', MOUSE_CONTROL_CONFIG, (
+        ('mouse_enable_check', 'setChecked', 'enabled'),
+        ('mouse_gesture_type_combo', 'setCurrentText', 'gesture_type'),
+        ('mouse_landmark_combo', 'setCurrentText', 'landmark'),
+        ('mouse_sensitivity_spin', 'setValue', 'sensitivity'),
+        ('mouse_deadzone_spin', 'setValue', 'deadzone_pixels'),
+        ('mouse_smoothing_spin', 'setValue', 'smoothing'),
+        ('mouse_invert_x_check', 'setChecked', 'invert_x'),
+        ('mouse_invert_y_check', 'setChecked', 'invert_y'),
+        ('mouse_activation_frames_spin', 'setValue', 'activation_frames'),
+        ('mouse_deactivation_frames_spin', 'setValue', 'deactivation_frames'),
+    )),
+)
+
+# Widget attribute names covered by _SETTINGS_SCHEMA
+_SCHEMA_WIDGET_ATTRS = tuple(attr for _, _, fields in _SETTINGS_SCHEMA for attr, _, _ in fields)
+
+# Getter matching each setter used in _SETTINGS_SCHEMA
+_GETTERS = {
+    'setValue': 'value',
+    'setChecked': 'isChecked',
+    'setText': 'text',
+    'setCurrentText': 'currentText',
+    'setCurrentIndex': 'currentIndex',
+}
+
+# Backing file path -> ((st_mtime_ns, st_size, st_ino), parsed "settings" value)
+_SETTINGS_READ_CACHE: Dict[str, Tuple[Tuple[int, int, int], Optional[Dict[str, Any]]]] = {}
+_SETTINGS_READ_LOCK = threading.Lock()
+
+
+@contextmanager
+def _signals_blocked(widgets):
+    """Block signals on the given widgets, restoring each one's previous state on exit"""
+    previous = []
+    for w in widgets:
+        try:
+            previous.append((w, w.blockSignals(True)))
+        except RuntimeError:
+            # Widget has been deleted
+            pass
+    try:
+        yield
+    finally:
+        for w, was_blocked in previous:
+            try:
+                w.blockSignals(was_blocked)
+            except RuntimeError:
+                # Widget has been deleted
+                pass
+
+
+def _settings_file_signature(path: str) -> Optional[Tuple[int, int, int]]:
+    """Cheap change signature of a settings file, or None if it can't be stat'ed (e.g. registry)"""
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def load_saved_settings(qsettings) -> Optional[Dict[str, Any]]:
+    """
+    Parse the persisted "settings" JSON, reusing the previous parse while the
+    backing file is unchanged. The returned dict is shared; treat it as read-only.
+    """
+    path = qsettings.fileName()
+    signature = _settings_file_signature(path)
+    if signature is not None:
+        with _SETTINGS_READ_LOCK:
+            cached = _SETTINGS_READ_CACHE.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+    settings_str = qsettings.value("settings")
+    settings = json.loads(settings_str) if settings_str else None
+    if signature is not None:
+        with _SETTINGS_READ_LOCK:
+            _SETTINGS_READ_CACHE[path] = (signature, settings)
+    return settings
+
+
+def _remember_saved_settings(qsettings, settings: Optional[Dict[str, Any]]):
+    """Record settings just written (and synced) so the next load skips the parse"""
+    path = qsettings.fileName()
+    signature = _settings_file_signature(path)
+    with _SETTINGS_READ_LOCK:
+        if signature is None:
+            _SETTINGS_READ_CACHE.pop(path, None)
+        else:
+            _SETTINGS_READ_CACHE[path] = (signature, settings)
+
+
+class _CachedQSettings:
+    """
+    In-memory front for a QSettings store
+
+    Each key is read from the backend (registry/ini file) at most once;
+    writes only mark changed keys dirty and reach the backend on flush().
+    """
+
+    def __init__(self, qsettings: QSettings):
+        self._qsettings = qsettings
+        self._cache: Dict[str, Any] = {}
+        self._dirty: Set[str] = set()
+
+    def value(self, key: str, default: Any = None) -> Any:
+        """Get a value, reading the backend only on first access"""
+        if key not in self._cache:
+            self._cache[key] = self._qsettings.value(key)
+        value = self._cache[key]
+        return default if value is None else value
+
+    def contains(self, key: str) -> bool:
+        """Check whether a key has a stored value"""
+        return self.value(key) is not None
+
+    def setValue(self, key: str, value: Any):
+        """Set a value; values equal to the stored one are not marked dirty"""
+        if key not in self._cache:
+            self._cache[key] = self._qsettings.value(key)
+        if self._cache[key] == value:
+            return
+        self._cache[key] = value
+        self._dirty.add(key)
+
+    def remove(self, key: str):
+        """Remove a key (on the next flush)"""
+        if key in self._cache and self._cache[key] is None:
+            return
+        self._cache[key] = None
+        self._dirty.add(key)
+
+    def fileName(self) -> str:
+        """Path of the backing store"""
+        return self._qsettings.fileName()
+
+    def flush(self):
+        """Write dirty keys to the backend in one batch"""
+        if not self._dirty:
+            return
+        for key in self._dirty:
+            value = self._cache[key]
+            if value is None:
+                self._qsettings.remove(key)
+            else:
+                self._qsettings.setValue(key, value)
+        self._dirty.clear()
+        self._qsettings.sync()
+
+
 class SettingsDialog(QDialog):
     """
     GFLOW-17: Comprehensive Settings Dialog
@@ -44,6 +255,33 @@ class SettingsDialog(QDialog):
 
     settings_changed = Signal(dict)  # Emitted when settings are applied
 
+    # Dialog-wide button styles, parsed once and matched by object name
+    _QSS = """
+        QPushButton#reset, QPushButton#primary {
+            color: white;
+            border: none;
+            padding: 8px 16px;
+            border-radius: 4px;
+        }
+        QPushButton#reset { background-color: #e74c3c; }
+        QPushButton#reset:hover { background-color: #c0392b; }
+        QPushButton#primary { background-color: #3498db; min-width: 80px; }
+        QPushButton#primary:hover { background-color: #2980b9; }
+    """
+
+    # (factory, tab title, settings section) in display order; each tab's
+    # widgets are built the first time the tab is shown
+    _TABS = (
+        ('create_webcam_tab', "Webcam", 'webcam'),
+        ('create_mediapipe_tab', "MediaPipe", 'mediapipe'),
+        ('create_gesture_tab', "Gesture Recognition", 'gesture'),
+        ('create_performance_tab', "Performance", 'performance'),
+        ('create_ui_tab', "User Interface", 'ui'),
+        ('create_action_execution_tab', "Action Execution", 'action_execution'),
+        ('create_mouse_control_tab', "Mouse Control", 'mouse_control'),  # GFLOW-E04
+        ('create_visual_feedback_tab', "Visual Feedback", 'visual_feedback'),  # GFLOW-19
+    )
+
     def __init__(self, parent=None, profile_manager=None, custom_gesture_manager=None):
         super().__init__(parent)
         self.setWindowTitle("GestureFlow Settings")
@@ -53,13 +291,17 @@ class SettingsDialog(QDialog):
         # Injected managers to reflect current profile context
         self.profile_manager = profile_manager
         self.custom_gesture_manager = custom_gesture_manager
+        # Built on first use when no manager was injected (reads the profile store)
+        self._fallback_cgm: Optional[CustomGestureManager] = None
 
         # Store original settings for cancel functionality
         self.original_settings = self.get_current_settings()
         self.current_settings = self.original_settings.copy()
+        # Settings that last passed validate_settings
+        self._last_valid_settings: Optional[Dict[str, Any]] = None
 
-        # QSettings for persistent storage
-        self.qsettings = QSettings("GestureFlow", "Settings")
+        # QSettings for persistent storage, cached in memory and flushed on apply
+        self.qsettings = _CachedQSettings(QSettings("GestureFlow", "Settings"))
 
         self.setup_ui()
         self.setup_connections()
@@ -68,6 +310,7 @@ class SettingsDialog(QDialog):
     def setup_ui(self):
         """Setup the user interface with tabbed settings"""
         layout = QVBoxLayout(self)
+        self.setStyleSheet(self._QSS)
 
         # Title
         title_label = QLabel("Application Settings")
@@ -82,35 +325,31 @@ class SettingsDialog(QDialog):
         self.tab_widget = QTabWidget()
         layout.addWidget(self.tab_widget)
 
-        # Create tabs
-        self.create_webcam_tab()
-        self.create_mediapipe_tab()
-        self.create_gesture_tab()
-        self.create_performance_tab()
-        self.create_ui_tab()
-        self.create_custom_gesture_tab()
-        self.create_action_execution_tab()
-        self.create_mouse_control_tab()  # GFLOW-E04
-
-        self.create_visual_feedback_tab()  # GFLOW-19
+        # Create tabs: empty placeholders now, real contents on first show
+        self._unbuilt_tabs: Dict[int, Tuple[str, str]] = {}
+        self._unbuilt_sections: Set[str] = set()
+        # Loaded settings for sections whose tab is not built yet
+        self._pending_settings: Dict[str, Any] = {}
+        # Built sections -> [(key, bound setter, bound getter)], filled on first use
+        self._bindings: Dict[str, list] = {}
+        for factory, title, section in self._TABS:
+            placeholder = QWidget()
+            QVBoxLayout(placeholder).setContentsMargins(0, 0, 0, 0)
+            index = self.tab_widget.addTab(placeholder, title)
+            self._unbuilt_tabs[index] = (factory, section)
+            self._unbuilt_sections.add(section)
+        self._materialize_tab(self.tab_widget.currentIndex())
+
+        # Custom gesture settings have no tab, so they stay "unbuilt": loaded
+        # values are kept in _pending_settings and passed through on collect
+        self._unbuilt_sections.add('custom_gesture')
 
         # Button layout
         button_layout = QHBoxLayout()
 
         # Reset to defaults button
         self.reset_button = QPushButton("Reset to Defaults")
-        self.reset_button.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-        """)
+        self.reset_button.setObjectName("reset")
         button_layout.addWidget(self.reset_button)
 
         button_layout.addStretch()
@@ -122,19 +361,7 @@ class SettingsDialog(QDialog):
 
         # Style standard buttons
         for btn in [self.cancel_button, self.apply_button, self.ok_button]:
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #3498db;
-                    color: white;
-                    border: none;
-                    padding: 8px 16px;
-                    border-radius: 4px;
-                    min-width: 80px;
-                }
-                QPushButton:hover {
-                    background-color: #2980b9;
-                }
-            """)
+            btn.setObjectName("primary")
 
         button_layout.addWidget(self.cancel_button)
         button_layout.addWidget(self.apply_button)
@@ -142,6 +369,20 @@ class SettingsDialog(QDialog):
 
         layout.addLayout(button_layout)
 
+    def _materialize_tab(self, index: int):
+        """Build a tab's contents the first time it is shown"""
+        entry = self._unbuilt_tabs.pop(index, None)
+        if entry is None:
+            return
+        factory, section = entry
+        self.tab_widget.widget(index).layout().addWidget(getattr(self, factory)())
+        self._unbuilt_sections.discard(section)
+
+        # Apply settings that were loaded before the tab existed
+        pending = self._pending_settings.pop(section, None)
+        if pending is not None:
+            self.apply_loaded_settings({section: pending})
+
     def create_webcam_tab(self):
         """Create webcam settings tab"""
         tab = QWidget()
@@ -182,7 +423,7 @@ class SettingsDialog(QDialog):
         layout.addWidget(webcam_group)
         layout.addStretch()
 
-        self.tab_widget.addTab(tab, "Webcam")
+        return tab
 
     def create_mediapipe_tab(self):
         """Create MediaPipe settings tab"""
@@ -217,10 +458,17 @@ class SettingsDialog(QDialog):
         self.tracking_conf_spin.setToolTip("Minimum confidence for hand tracking between frames (0.1-1.0)")
         mp_layout.addRow("Tracking Confidence:", self.tracking_conf_spin)
 
+        # Model complexity (index matches MediaPipe's model_complexity value)
+        self.model_complexity_combo = QComboBox()
+        self.model_complexity_combo.addItems(['Lite (faster)', 'Full (high accuracy)'])
+        self.model_complexity_combo.setCurrentIndex(MEDIAPIPE_CONFIG.get('model_complexity', 0))
+        self.model_complexity_combo.setToolTip("Lite model is roughly twice as fast; Full model gives slightly more accurate landmarks")
+        mp_layout.addRow("Model:", self.model_complexity_combo)
+
         layout.addWidget(mp_group)
         layout.addStretch()
 
-        self.tab_widget.addTab(tab, "MediaPipe")
+        return tab
 
     def create_gesture_tab(self):
         """Create gesture recognition settings tab"""
@@ -262,7 +510,7 @@ class SettingsDialog(QDialog):
         layout.addWidget(gesture_group)
         layout.addStretch()
 
-        self.tab_widget.addTab(tab, "Gesture Recognition")
+        return tab
 
     def create_performance_tab(self):
         """Create performance settings tab"""
@@ -300,7 +548,7 @@ class SettingsDialog(QDialog):
         layout.addWidget(perf_group)
         layout.addStretch()
 
-        self.tab_widget.addTab(tab, "Performance")
+        return tab
 
     def create_ui_tab(self):
         """Create UI settings tab"""
@@ -341,65 +589,8 @@ class SettingsDialog(QDialog):
         layout.addWidget(ui_group)
         layout.addStretch()
 
-        self.tab_widget.addTab(tab, "User Interface")
-
-    def create_custom_gesture_tab(self):
-        """Create custom gesture settings tab"""
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
+        return tab
 
-        # Custom Gesture Configuration Group
-        custom_group = QGroupBox("Custom Gesture Settings")
-        custom_layout = QFormLayout(custom_group)
-
-        # Samples per gesture
-        self.samples_spin = QSpinBox()
-        self.samples_spin.setRange(5, 50)
-        self.samples_spin.setValue(CUSTOM_GESTURE_CONFIG['samples_per_gesture'])
-        custom_layout.addRow("Samples per Gesture:", self.samples_spin)
-
-        # Sample delay
-        self.sample_delay_spin = QDoubleSpinBox()
-        self.sample_delay_spin.setRange(0.5, 5.0)
-        self.sample_delay_spin.setSingleStep(0.1)
-        self.sample_delay_spin.setDecimals(1)
-        self.sample_delay_spin.setValue(CUSTOM_GESTURE_CONFIG['sample_delay_seconds'])
-        custom_layout.addRow("Sample Delay (seconds):", self.sample_delay_spin)
-
-        # Recording countdown
-        self.countdown_spin = QSpinBox()
-        self.countdown_spin.setRange(1, 10)
-        self.countdown_spin.setValue(CUSTOM_GESTURE_CONFIG['recording_countdown'])
-        custom_layout.addRow("Recording Countdown:", self.countdown_spin)
-
-        # Confidence threshold
-        self.custom_confidence_spin = QDoubleSpinBox()
-        self.custom_confidence_spin.setRange(0.1, 1.0)
-        self.custom_confidence_spin.setSingleStep(0.1)
-        self.custom_confidence_spin.setDecimals(2)
-        self.custom_confidence_spin.setValue(CUSTOM_GESTURE_CONFIG['min_confidence_threshold'])
-        custom_layout.addRow("Min Confidence:", self.custom_confidence_spin)
-
-        # Similarity threshold
-        self.similarity_spin = QDoubleSpinBox()
-        self.similarity_spin.setRange(0.5, 1.0)
-        self.similarity_spin.setSingleStep(0.05)
-        self.similarity_spin.setDecimals(2)
-        self.similarity_spin.setValue(CUSTOM_GESTURE_CONFIG['similarity_threshold'])
-        custom_layout.addRow("Similarity Threshold:", self.similarity_spin)
-
-        # Backup enabled
-        self.backup_check = QCheckBox()
-        self.backup_check.setChecked(CUSTOM_GESTURE_CONFIG['backup_enabled'])
-        custom_layout.addRow("Enable Backup:", self.backup_check)
-
-        # Gesture priority
-        self.priority_check = QCheckBox()
-        self.priority_check.setChecked(CUSTOM_GESTURE_CONFIG['enable_gesture_priority'])
-        custom_layout.addRow("Predefined Priority:", self.priority_check)
-
-        layout.addWidget(custom_group)
-        layout.addStretch()
     def create_mouse_control_tab(self):
         """GFLOW-E04: Create dynamic mouse control settings tab"""
         tab = QWidget()
@@ -488,36 +679,49 @@ class SettingsDialog(QDialog):
 
         layout.addWidget(group)
         layout.addStretch()
-        self.tab_widget.addTab(tab, "Mouse Control")
+        return tab
 
+    @Slot()
     def populate_mouse_gesture_list(self):
         """Populate gesture dropdown based on selected type and current profile's custom gestures."""
+        if not hasattr(self, 'mouse_gesture_combo'):
+            return  # Mouse control tab not built yet
         try:
-            self.mouse_gesture_combo.clear()
             gtype = self.mouse_gesture_type_combo.currentText().lower() if hasattr(self, 'mouse_gesture_type_combo') else 'predefined'
 
+            # Collect (display, data) pairs first so the combo is mutated in one batch
+            entries = []
             if gtype == 'predefined':
                 # Use config PREDEFINED_GESTURES
                 for gesture_id, gesture_data in PREDEFINED_GESTURES.items():
                     if gesture_data.get('enabled', True):
                         display = gesture_data.get('name', gesture_id.replace('_', ' ').title())
-                        self.mouse_gesture_combo.addItem(display, gesture_id)
+                        entries.append((display, gesture_id))
             elif gtype == 'custom':
                 # Use injected custom_gesture_manager if available (current profile)
                 if self.custom_gesture_manager is not None:
-                    for g in self.custom_gesture_manager.get_gesture_list():
-                        if g.get('is_trained', False):
-                            name = g['name']
-                            self.mouse_gesture_combo.addItem(name, name)
+                    cgm = self.custom_gesture_manager
                 else:
-                    # Fallback: use current profile via ProfileManager
-                    from profile_manager import ProfileManager
-                    pm = ProfileManager()
-                    cgm = CustomGestureManager(pm.get_current_profile_name() or 'default')
-                    for g in cgm.get_gesture_list():
-                        if g.get('is_trained', False):
-                            name = g['name']
-                            self.mouse_gesture_combo.addItem(name, name)
+                    # Fallback: use current profile via ProfileManager (loaded once per dialog)
+                    if self._fallback_cgm is None:
+                        from profile_manager import ProfileManager
+                        pm = ProfileManager()
+                        self._fallback_cgm = CustomGestureManager(pm.get_current_profile_name() or 'default')
+                    cgm = self._fallback_cgm
+                for g in cgm.get_gesture_list():
+                    if g.get('is_trained', False):
+                        entries.append((g['name'], g['name']))
+
+            # Silence per-item change signals while rebuilding the model
+            with QSignalBlocker(self.mouse_gesture_combo):
+                self.mouse_gesture_combo.clear()
+                items = []
+                for display, data in entries:
+                    item = QStandardItem(display)
+                    item.setData(data, Qt.UserRole)
+                    items.append(item)
+                if items:
+                    self.mouse_gesture_combo.model().invisibleRootItem().appendRows(items)
 
             # Ensure current config selection remains if present
             current_name = MOUSE_CONTROL_CONFIG.get('gesture_name', 'pointing')
@@ -589,7 +793,7 @@ class SettingsDialog(QDialog):
         layout.addWidget(action_group)
         layout.addStretch()
 
-        self.tab_widget.addTab(tab, "Action Execution")
+        return tab
 
     def create_visual_feedback_tab(self):
         """GFLOW-19: Create visual feedback settings tab"""
@@ -656,14 +860,17 @@ class SettingsDialog(QDialog):
         layout.addWidget(notifications_group)
         layout.addStretch()
 
-        self.tab_widget.addTab(tab, "Visual Feedback")
+        return tab
 
     def setup_connections(self):
         """Setup signal connections"""
+        # Handlers are declared with @Slot(), so each connect resolves to a
+        # registered meta-method rather than a dynamically wrapped callable
         self.ok_button.clicked.connect(self.accept_settings)
         self.apply_button.clicked.connect(self.apply_settings)
         self.cancel_button.clicked.connect(self.reject)
         self.reset_button.clicked.connect(self.reset_to_defaults)
+        self.tab_widget.currentChanged.connect(self._materialize_tab)
 
     def get_current_settings(self) -> Dict[str, Any]:
         """Get current settings from configuration"""
@@ -684,255 +891,106 @@ class SettingsDialog(QDialog):
         # Load from QSettings if available
         if self.qsettings.contains("settings"):
             try:
-                settings_str = self.qsettings.value("settings")
-                if settings_str:
-                    saved_settings = json.loads(settings_str)
+                saved_settings = load_saved_settings(self.qsettings)
+                if saved_settings:
                     self.apply_loaded_settings(saved_settings)
             except (json.JSONDecodeError, Exception) as e:
                 print(f"Error loading saved settings: {e}")
 
-    def apply_loaded_settings(self, settings: Dict[str, Any]):
-        """Apply loaded settings to UI controls"""
+    def _schema_widgets(self):
+        """Built widgets listed in _SETTINGS_SCHEMA"""
+        widgets = (getattr(self, attr, None) for attr in _SCHEMA_WIDGET_ATTRS)
+        return [w for w in widgets if w is not None]
+
+    def _section_bindings(self, section: str, fields) -> list:
+        """Bound (key, setter, getter) triples for a built section, resolved once"""
+        bindings = self._bindings.get(section)
+        if bindings is None:
+            bindings = []
+            for attr, setter, key in fields:
+                widget = getattr(self, attr, None)
+                if widget is not None:
+                    bindings.append((key, getattr(widget, setter), getattr(widget, _GETTERS[setter])))
+            self._bindings[section] = bindings
+        return bindings
+
+    def _apply_section(self, section: str, data: Dict[str, Any], defaults: Dict[str, Any], fields):
+        """Apply one loaded section; a failure skips only the rest of that section"""
+        merged = {**defaults, **data}
         try:
-            # Helper function to safely set widget values
-            def safe_set_value(widget, method_name, value, *args):
+            for key, setter, _ in self._section_bindings(section, fields):
                 try:
-                    if widget and hasattr(widget, method_name):
-                        method = getattr(widget, method_name)
-                        if callable(method):
-                            method(value, *args)
+                    setter(merged[key])
                 except RuntimeError:
-                    # Widget has been deleted, skip
+                    # Widget has been deleted
                     pass
+        except Exception as e:
+            print(f"Error applying {section} settings: {e}")
+
+    def apply_loaded_settings(self, settings: Dict[str, Any]):
+        """Apply loaded settings to UI controls"""
+        # Sections whose tab is not built yet are applied when it is
+        for section in self._unbuilt_sections.intersection(settings):
+            self._pending_settings[section] = settings[section]
+        settings = {k: v for k, v in settings.items() if k not in self._unbuilt_sections}
+
+        # No per-widget change signals while loading (the gesture list is
+        # repopulated explicitly below)
+        with _signals_blocked(self._schema_widgets()):
+            for section, defaults, fields in _SETTINGS_SCHEMA:
+                data = settings.get(section)
+                if data is not None:
+                    self._apply_section(section, data, defaults, fields)
 
-            # Webcam settings
-            if 'webcam' in settings:
-                webcam = settings['webcam']
-                safe_set_value(self.width_spin, 'setValue', webcam.get('width', WEBCAM_CONFIG['width']))
-                safe_set_value(self.height_spin, 'setValue', webcam.get('height', WEBCAM_CONFIG['height']))
-                safe_set_value(self.fps_spin, 'setValue', webcam.get('fps', WEBCAM_CONFIG['fps']))
-                safe_set_value(self.device_spin, 'setValue', webcam.get('device_id', WEBCAM_CONFIG['device_id']))
-                safe_set_value(self.flip_check, 'setChecked', webcam.get('flip_horizontal', WEBCAM_CONFIG['flip_horizontal']))
-
-            # MediaPipe settings
-            if 'mediapipe' in settings:
-                mp = settings['mediapipe']
-                safe_set_value(self.max_hands_spin, 'setValue', mp.get('max_num_hands', MEDIAPIPE_CONFIG['max_num_hands']))
-                safe_set_value(self.detection_conf_spin, 'setValue', mp.get('min_detection_confidence', MEDIAPIPE_CONFIG['min_detection_confidence']))
-                safe_set_value(self.tracking_conf_spin, 'setValue', mp.get('min_tracking_confidence', MEDIAPIPE_CONFIG['min_tracking_confidence']))
-
-            # Gesture settings
-            if 'gesture' in settings:
-                gesture = settings['gesture']
-                safe_set_value(self.recognition_threshold_spin, 'setValue', gesture.get('recognition_threshold', GESTURE_CONFIG['recognition_threshold']))
-                safe_set_value(self.hold_time_spin, 'setValue', gesture.get('gesture_hold_time', GESTURE_CONFIG['gesture_hold_time']))
-                safe_set_value(self.smoothing_spin, 'setValue', gesture.get('smoothing_frames', GESTURE_CONFIG['smoothing_frames']))
-                safe_set_value(self.debug_check, 'setChecked', gesture.get('debug_mode', GESTURE_CONFIG['debug_mode']))
-
-            # Performance settings
-            if 'performance' in settings:
-                perf = settings['performance']
-                safe_set_value(self.fps_interval_spin, 'setValue', perf.get('fps_update_interval', PERFORMANCE_CONFIG['fps_update_interval']))
-                safe_set_value(self.history_spin, 'setValue', perf.get('max_recognition_history', PERFORMANCE_CONFIG['max_recognition_history']))
-                safe_set_value(self.target_fps_spin, 'setValue', perf.get('target_fps', PERFORMANCE_CONFIG['target_fps']))
-                safe_set_value(self.max_latency_spin, 'setValue', perf.get('max_latency_ms', PERFORMANCE_CONFIG['max_latency_ms']))
-
-            # UI settings
-            if 'ui' in settings:
-                ui = settings['ui']
-                safe_set_value(self.window_title_edit, 'setText', ui.get('window_title', UI_CONFIG['window_title']))
-                safe_set_value(self.window_width_spin, 'setValue', ui.get('window_width', UI_CONFIG['window_width']))
-                safe_set_value(self.window_height_spin, 'setValue', ui.get('window_height', UI_CONFIG['window_height']))
-                safe_set_value(self.video_width_spin, 'setValue', ui.get('video_width', UI_CONFIG['video_width']))
-                safe_set_value(self.video_height_spin, 'setValue', ui.get('video_height', UI_CONFIG['video_height']))
-
-            # Custom gesture settings
-            if 'custom_gesture' in settings:
-                custom = settings['custom_gesture']
-                safe_set_value(self.samples_spin, 'setValue', custom.get('samples_per_gesture', CUSTOM_GESTURE_CONFIG['samples_per_gesture']))
-                safe_set_value(self.sample_delay_spin, 'setValue', custom.get('sample_delay_seconds', CUSTOM_GESTURE_CONFIG['sample_delay_seconds']))
-                safe_set_value(self.countdown_spin, 'setValue', custom.get('recording_countdown', CUSTOM_GESTURE_CONFIG['recording_countdown']))
-                safe_set_value(self.custom_confidence_spin, 'setValue', custom.get('min_confidence_threshold', CUSTOM_GESTURE_CONFIG['min_confidence_threshold']))
-                safe_set_value(self.similarity_spin, 'setValue', custom.get('similarity_threshold', CUSTOM_GESTURE_CONFIG['similarity_threshold']))
-                safe_set_value(self.backup_check, 'setChecked', custom.get('backup_enabled', CUSTOM_GESTURE_CONFIG['backup_enabled']))
-                safe_set_value(self.priority_check, 'setChecked', custom.get('enable_gesture_priority', CUSTOM_GESTURE_CONFIG['enable_gesture_priority']))
-
-            # Action execution settings
-            if 'action_execution' in settings:
-                action = settings['action_execution']
-                safe_set_value(self.input_library_combo, 'setCurrentText', action.get('input_library', ACTION_EXECUTION_CONFIG['input_library']))
-                safe_set_value(self.failsafe_check, 'setChecked', action.get('enable_failsafe', ACTION_EXECUTION_CONFIG['enable_failsafe']))
-                safe_set_value(self.action_delay_spin, 'setValue', action.get('default_action_delay', ACTION_EXECUTION_CONFIG['default_action_delay']))
-                safe_set_value(self.mouse_duration_spin, 'setValue', action.get('mouse_movement_duration', ACTION_EXECUTION_CONFIG['mouse_movement_duration']))
-                safe_set_value(self.timeout_spin, 'setValue', action.get('action_timeout', ACTION_EXECUTION_CONFIG['action_timeout']))
-                safe_set_value(self.log_actions_check, 'setChecked', action.get('log_all_actions', ACTION_EXECUTION_CONFIG['log_all_actions']))
-                safe_set_value(self.async_check, 'setChecked', action.get('async_execution', ACTION_EXECUTION_CONFIG['async_execution']))
-
-            # GFLOW-19: Visual feedback settings
-            if 'visual_feedback' in settings:
-                visual = settings['visual_feedback']
-                safe_set_value(self.show_landmarks_check, 'setChecked', visual.get('show_hand_landmarks', VISUAL_FEEDBACK_CONFIG['show_hand_landmarks']))
-                safe_set_value(self.landmark_thickness_spin, 'setValue', visual.get('landmark_thickness', VISUAL_FEEDBACK_CONFIG['landmark_thickness']))
-                safe_set_value(self.connection_thickness_spin, 'setValue', visual.get('connection_thickness', VISUAL_FEEDBACK_CONFIG['connection_thickness']))
-                safe_set_value(self.show_notifications_check, 'setChecked', visual.get('show_gesture_notifications', VISUAL_FEEDBACK_CONFIG['show_gesture_notifications']))
-                safe_set_value(self.notification_duration_spin, 'setValue', visual.get('notification_duration', VISUAL_FEEDBACK_CONFIG['notification_duration']))
-                safe_set_value(self.notification_position_combo, 'setCurrentText', visual.get('notification_position', VISUAL_FEEDBACK_CONFIG['notification_position']))
-                safe_set_value(self.notification_font_size_spin, 'setValue', visual.get('notification_font_size', VISUAL_FEEDBACK_CONFIG['notification_font_size']))
-                safe_set_value(self.enable_animations_check, 'setChecked', visual.get('enable_notification_animations', VISUAL_FEEDBACK_CONFIG['enable_notification_animations']))
-
-            # GFLOW-E04: Mouse control settings
-            if 'mouse_control' in settings:
-                mc = settings['mouse_control']
-                safe_set_value(self.mouse_enable_check, 'setChecked', mc.get('enabled', True))
-                safe_set_value(self.mouse_gesture_type_combo, 'setCurrentText', mc.get('gesture_type', 'predefined'))
-                # Repopulate and select gesture
+        try:
+            # GFLOW-E04: Repopulate and select gesture once the gesture type is set
+            mouse_control = settings.get('mouse_control')
+            if mouse_control is not None and hasattr(self, 'mouse_gesture_combo'):
+                gesture_name = mouse_control.get('gesture_name', MOUSE_CONTROL_CONFIG['gesture_name'])
                 self.populate_mouse_gesture_list()
-                idx = self.mouse_gesture_combo.findData(mc.get('gesture_name', 'pointing'))
+                idx = self.mouse_gesture_combo.findData(gesture_name)
                 if idx == -1:
-                    idx = self.mouse_gesture_combo.findText(mc.get('gesture_name', 'pointing'))
+                    idx = self.mouse_gesture_combo.findText(gesture_name)
                 if idx >= 0:
                     self.mouse_gesture_combo.setCurrentIndex(idx)
-                safe_set_value(self.mouse_landmark_combo, 'setCurrentText', mc.get('landmark', 'index_tip'))
-                safe_set_value(self.mouse_sensitivity_spin, 'setValue', mc.get('sensitivity', 1.5))
-                safe_set_value(self.mouse_deadzone_spin, 'setValue', mc.get('deadzone_pixels', 3))
-                safe_set_value(self.mouse_smoothing_spin, 'setValue', mc.get('smoothing', 0.5))
-                safe_set_value(self.mouse_invert_x_check, 'setChecked', mc.get('invert_x', False))
-                safe_set_value(self.mouse_invert_y_check, 'setChecked', mc.get('invert_y', False))
-                safe_set_value(self.mouse_activation_frames_spin, 'setValue', mc.get('activation_frames', 3))
-                safe_set_value(self.mouse_deactivation_frames_spin, 'setValue', mc.get('deactivation_frames', 2))
 
         except Exception as e:
             print(f"Error applying loaded settings: {e}")
 
     def collect_current_settings(self) -> Dict[str, Any]:
         """Collect current settings from UI controls"""
-        # Helper function to safely get widget values
-        def safe_get_value(widget, method_name='value', default=None):
+        # Config values for every key, overwritten by the built widgets;
+        # widgets of unbuilt tabs are absent, so those keep config values
+        settings = {}
+        for section, defaults, fields in _SETTINGS_SCHEMA:
+            values = dict(defaults)
+            if section not in self._unbuilt_sections:
+                for key, _, getter in self._section_bindings(section, fields):
+                    try:
+                        values[key] = getter()
+                    except RuntimeError:
+                        # Widget has been deleted
+                        pass
+            settings[section] = values
+
+        # GFLOW-E04: Gesture combo stores the id as item data
+        combo = getattr(self, 'mouse_gesture_combo', None)
+        if combo is not None:
             try:
-                if widget and hasattr(widget, method_name):
-                    method = getattr(widget, method_name)
-                    return method() if callable(method) else method
-                return default
+                settings['mouse_control']['gesture_name'] = combo.currentData() or combo.currentText()
             except RuntimeError:
-                # Widget has been deleted
-                return default
+                pass
 
-        return {
-            'webcam': {
-                'width': safe_get_value(self.width_spin, 'value', WEBCAM_CONFIG['width']),
-                'height': safe_get_value(self.height_spin, 'value', WEBCAM_CONFIG['height']),
-                'fps': safe_get_value(self.fps_spin, 'value', WEBCAM_CONFIG['fps']),
-                'device_id': safe_get_value(self.device_spin, 'value', WEBCAM_CONFIG['device_id']),
-                'flip_horizontal': safe_get_value(self.flip_check, 'isChecked', WEBCAM_CONFIG['flip_horizontal'])
-            },
-            'mediapipe': {
-                'static_image_mode': MEDIAPIPE_CONFIG['static_image_mode'],  # Keep original
-                'max_num_hands': safe_get_value(self.max_hands_spin, 'value', MEDIAPIPE_CONFIG['max_num_hands']),
-                'min_detection_confidence': safe_get_value(self.detection_conf_spin, 'value', MEDIAPIPE_CONFIG['min_detection_confidence']),
-                'min_tracking_confidence': safe_get_value(self.tracking_conf_spin, 'value', MEDIAPIPE_CONFIG['min_tracking_confidence'])
-            },
-            'gesture': {
-                'recognition_threshold': safe_get_value(self.recognition_threshold_spin, 'value', GESTURE_CONFIG['recognition_threshold']),
-                'gesture_hold_time': safe_get_value(self.hold_time_spin, 'value', GESTURE_CONFIG['gesture_hold_time']),
-                'smoothing_frames': safe_get_value(self.smoothing_spin, 'value', GESTURE_CONFIG['smoothing_frames']),
-                'debug_mode': safe_get_value(self.debug_check, 'isChecked', GESTURE_CONFIG['debug_mode'])
-            },
-            'performance': {
-                'fps_update_interval': safe_get_value(self.fps_interval_spin, 'value', PERFORMANCE_CONFIG['fps_update_interval']),
-                'max_recognition_history': safe_get_value(self.history_spin, 'value', PERFORMANCE_CONFIG['max_recognition_history']),
-                'target_fps': safe_get_value(self.target_fps_spin, 'value', PERFORMANCE_CONFIG['target_fps']),
-                'max_latency_ms': safe_get_value(self.max_latency_spin, 'value', PERFORMANCE_CONFIG['max_latency_ms'])
-            },
-            'ui': {
-                'window_title': safe_get_value(self.window_title_edit, 'text', UI_CONFIG['window_title']),
-                'window_width': safe_get_value(self.window_width_spin, 'value', UI_CONFIG['window_width']),
-                'window_height': safe_get_value(self.window_height_spin, 'value', UI_CONFIG['window_height']),
-                'video_width': safe_get_value(self.video_width_spin, 'value', UI_CONFIG['video_width']),
-                'video_height': safe_get_value(self.video_height_spin, 'value', UI_CONFIG['video_height'])
-            },
-            'custom_gesture': {
-                'data_directory': CUSTOM_GESTURE_CONFIG['data_directory'],  # Keep original paths
-                'models_directory': CUSTOM_GESTURE_CONFIG['models_directory'],
-                'samples_per_gesture': safe_get_value(self.samples_spin, 'value', CUSTOM_GESTURE_CONFIG['samples_per_gesture']),
-                'sample_delay_seconds': safe_get_value(self.sample_delay_spin, 'value', CUSTOM_GESTURE_CONFIG['sample_delay_seconds']),
-                'recording_countdown': safe_get_value(self.countdown_spin, 'value', CUSTOM_GESTURE_CONFIG['recording_countdown']),
-                'min_confidence_threshold': safe_get_value(self.custom_confidence_spin, 'value', CUSTOM_GESTURE_CONFIG['min_confidence_threshold']),
-                'feature_vector_size': CUSTOM_GESTURE_CONFIG['feature_vector_size'],  # Keep original
-                'similarity_threshold': safe_get_value(self.similarity_spin, 'value', CUSTOM_GESTURE_CONFIG['similarity_threshold']),
-                'svm_kernel': CUSTOM_GESTURE_CONFIG['svm_kernel'],  # Keep original
-                'svm_c': CUSTOM_GESTURE_CONFIG['svm_c'],  # Keep original
-                'cross_validation_folds': CUSTOM_GESTURE_CONFIG['cross_validation_folds'],  # Keep original
-                'max_gesture_name_length': CUSTOM_GESTURE_CONFIG['max_gesture_name_length'],  # Keep original
-                'backup_enabled': safe_get_value(self.backup_check, 'isChecked', CUSTOM_GESTURE_CONFIG['backup_enabled']),
-                'predefined_confidence_boost': CUSTOM_GESTURE_CONFIG['predefined_confidence_boost'],  # Keep original
-                'enable_gesture_priority': safe_get_value(self.priority_check, 'isChecked', CUSTOM_GESTURE_CONFIG['enable_gesture_priority'])
-            },
-            'action_execution': {
-                'input_library': safe_get_value(self.input_library_combo, 'currentText', ACTION_EXECUTION_CONFIG['input_library']),
-                'enable_failsafe': safe_get_value(self.failsafe_check, 'isChecked', ACTION_EXECUTION_CONFIG['enable_failsafe']),
-                'failsafe_corner': ACTION_EXECUTION_CONFIG['failsafe_corner'],  # Keep original
-                'require_confirmation': ACTION_EXECUTION_CONFIG['require_confirmation'],  # Keep original
-                'default_action_delay': safe_get_value(self.action_delay_spin, 'value', ACTION_EXECUTION_CONFIG['default_action_delay']),
-                'mouse_movement_duration': safe_get_value(self.mouse_duration_spin, 'value', ACTION_EXECUTION_CONFIG['mouse_movement_duration']),
-                'key_press_interval': ACTION_EXECUTION_CONFIG['key_press_interval'],  # Keep original
-                'action_timeout': safe_get_value(self.timeout_spin, 'value', ACTION_EXECUTION_CONFIG['action_timeout']),
-                'max_retry_attempts': ACTION_EXECUTION_CONFIG['max_retry_attempts'],  # Keep original
-                'error_recovery_delay': ACTION_EXECUTION_CONFIG['error_recovery_delay'],  # Keep original
-                'log_all_actions': safe_get_value(self.log_actions_check, 'isChecked', ACTION_EXECUTION_CONFIG['log_all_actions']),
-                'enable_undo': ACTION_EXECUTION_CONFIG['enable_undo'],  # Keep original
-                'async_execution': safe_get_value(self.async_check, 'isChecked', ACTION_EXECUTION_CONFIG['async_execution']),
-                'queue_max_size': ACTION_EXECUTION_CONFIG['queue_max_size'],  # Keep original
-                'execution_thread_pool': ACTION_EXECUTION_CONFIG['execution_thread_pool'],  # Keep original
-                'context_aware_execution': ACTION_EXECUTION_CONFIG['context_aware_execution'],  # Keep original
-                'application_detection': ACTION_EXECUTION_CONFIG['application_detection'],  # Keep original
-                'window_focus_check': ACTION_EXECUTION_CONFIG['window_focus_check']  # Keep original
-            },
-            # GFLOW-19: Visual feedback settings
-            'visual_feedback': {
-                'show_hand_landmarks': safe_get_value(self.show_landmarks_check, 'isChecked', VISUAL_FEEDBACK_CONFIG['show_hand_landmarks']),
-                'landmark_color': VISUAL_FEEDBACK_CONFIG['landmark_color'],  # Keep original
-                'landmark_thickness': safe_get_value(self.landmark_thickness_spin, 'value', VISUAL_FEEDBACK_CONFIG['landmark_thickness']),
-                'connection_color': VISUAL_FEEDBACK_CONFIG['connection_color'],  # Keep original
-                'connection_thickness': safe_get_value(self.connection_thickness_spin, 'value', VISUAL_FEEDBACK_CONFIG['connection_thickness']),
-                'show_gesture_notifications': safe_get_value(self.show_notifications_check, 'isChecked', VISUAL_FEEDBACK_CONFIG['show_gesture_notifications']),
-                'notification_duration': safe_get_value(self.notification_duration_spin, 'value', VISUAL_FEEDBACK_CONFIG['notification_duration']),
-                'notification_fade_duration': VISUAL_FEEDBACK_CONFIG['notification_fade_duration'],  # Keep original
-                'notification_position': safe_get_value(self.notification_position_combo, 'currentText', VISUAL_FEEDBACK_CONFIG['notification_position']),
-                'notification_offset_x': VISUAL_FEEDBACK_CONFIG['notification_offset_x'],  # Keep original
-                'notification_offset_y': VISUAL_FEEDBACK_CONFIG['notification_offset_y'],  # Keep original
-                'notification_background_color': VISUAL_FEEDBACK_CONFIG['notification_background_color'],  # Keep original
-                'notification_text_color': VISUAL_FEEDBACK_CONFIG['notification_text_color'],  # Keep original
-                'notification_border_color': VISUAL_FEEDBACK_CONFIG['notification_border_color'],  # Keep original
-                'notification_border_width': VISUAL_FEEDBACK_CONFIG['notification_border_width'],  # Keep original
-                'notification_border_radius': VISUAL_FEEDBACK_CONFIG['notification_border_radius'],  # Keep original
-                'notification_padding': VISUAL_FEEDBACK_CONFIG['notification_padding'],  # Keep original
-                'notification_font_size': safe_get_value(self.notification_font_size_spin, 'value', VISUAL_FEEDBACK_CONFIG['notification_font_size']),
-                'notification_font_weight': VISUAL_FEEDBACK_CONFIG['notification_font_weight'],  # Keep original
-                'enable_notification_animations': safe_get_value(self.enable_animations_check, 'isChecked', VISUAL_FEEDBACK_CONFIG['enable_notification_animations']),
-                'fade_in_duration': VISUAL_FEEDBACK_CONFIG['fade_in_duration'],  # Keep original
-                'fade_out_duration': VISUAL_FEEDBACK_CONFIG['fade_out_duration'],  # Keep original
-                'slide_distance': VISUAL_FEEDBACK_CONFIG['slide_distance'],  # Keep original
-                'max_notifications_queue': VISUAL_FEEDBACK_CONFIG['max_notifications_queue'],  # Keep original
-                'notification_update_interval': VISUAL_FEEDBACK_CONFIG['notification_update_interval']  # Keep original
-            }
-,
-            # GFLOW-E04: Mouse control settings
-            'mouse_control': {
-                'enabled': safe_get_value(self.mouse_enable_check, 'isChecked', MOUSE_CONTROL_CONFIG['enabled']),
-                'gesture_type': safe_get_value(self.mouse_gesture_type_combo, 'currentText', MOUSE_CONTROL_CONFIG['gesture_type']),
-                'gesture_name': safe_get_value(self.mouse_gesture_combo, 'currentData', MOUSE_CONTROL_CONFIG['gesture_name']) or safe_get_value(self.mouse_gesture_combo, 'currentText', MOUSE_CONTROL_CONFIG['gesture_name']),
-                'landmark': safe_get_value(self.mouse_landmark_combo, 'currentText', MOUSE_CONTROL_CONFIG['landmark']),
-                'sensitivity': safe_get_value(self.mouse_sensitivity_spin, 'value', MOUSE_CONTROL_CONFIG['sensitivity']),
-                'deadzone_pixels': safe_get_value(self.mouse_deadzone_spin, 'value', MOUSE_CONTROL_CONFIG['deadzone_pixels']),
-                'smoothing': safe_get_value(self.mouse_smoothing_spin, 'value', MOUSE_CONTROL_CONFIG['smoothing']),
-                'invert_x': safe_get_value(self.mouse_invert_x_check, 'isChecked', MOUSE_CONTROL_CONFIG['invert_x']),
-                'invert_y': safe_get_value(self.mouse_invert_y_check, 'isChecked', MOUSE_CONTROL_CONFIG['invert_y']),
-                'activation_frames': safe_get_value(self.mouse_activation_frames_spin, 'value', MOUSE_CONTROL_CONFIG['activation_frames']),
-                'deactivation_frames': safe_get_value(self.mouse_deactivation_frames_spin, 'value', MOUSE_CONTROL_CONFIG['deactivation_frames'])
-            }
-        }
+        # ...overlaid with any settings loaded for them while unbuilt
+        for section in self._unbuilt_sections:
+            pending = self._pending_settings.get(section)
+            if pending:
+                settings[section] = {k: pending.get(k, v) for k, v in settings[section].items()}
 
+        return settings
 
+
+    @Slot()
     def apply_settings(self):
         """Apply current settings"""
         try:
@@ -951,8 +1009,11 @@ class SettingsDialog(QDialog):
             if not self.validate_settings(new_settings):
                 return
 
-            # Save to persistent storage
+            # Save to persistent storage; the store is only rewritten when the
+            # JSON differs from what is already persisted
             self.qsettings.setValue("settings", json.dumps(new_settings))
+            self.qsettings.flush()
+            _remember_saved_settings(self.qsettings, new_settings)
 
             # Update current settings
             self.current_settings = new_settings
@@ -971,6 +1032,7 @@ class SettingsDialog(QDialog):
                 f"Failed to apply settings: {str(e)}"
             )
 
+    @Slot()
     def accept_settings(self):
         """Apply settings and close dialog"""
         try:
@@ -989,8 +1051,11 @@ class SettingsDialog(QDialog):
             if not self.validate_settings(new_settings):
                 return
 
-            # Save to persistent storage
+            # Save to persistent storage; the store is only rewritten when the
+            # JSON differs from what is already persisted
             self.qsettings.setValue("settings", json.dumps(new_settings))
+            self.qsettings.flush()
+            _remember_saved_settings(self.qsettings, new_settings)
 
             # Update current settings
             self.current_settings = new_settings
@@ -1009,6 +1074,9 @@ class SettingsDialog(QDialog):
 
     def validate_settings(self, settings: Dict[str, Any]) -> bool:
         """Validate settings before applying"""
+        # Same values as the last successful validation (e.g. OK after Apply)
+        if settings == self._last_valid_settings:
+            return True
         try:
             # Validate webcam settings
             webcam = settings['webcam']
@@ -1068,12 +1136,14 @@ class SettingsDialog(QDialog):
                 )
                 return False
 
+            self._last_valid_settings = settings
             return True
 
         except Exception as e:
             QMessageBox.critical(self, "Validation Error", f"Settings validation failed: {str(e)}")
             return False
 
+    @Slot()
     def reset_to_defaults(self):
         """Reset all settings to default values"""
         reply = QMessageBox.question(
@@ -1089,6 +1159,8 @@ class SettingsDialog(QDialog):
 
             # Clear persistent storage
             self.qsettings.remove("settings")
+            self.qsettings.flush()
+            _remember_saved_settings(self.qsettings, None)
 
             QMessageBox.information(
                 self, "Settings Reset",